@@ -1,7 +1,9 @@
-from typing import Callable, Optional, TypeVar
+from typing import Awaitable, Callable, Optional, TypeVar
 
 from aioarango.connection import Connection
-from aioarango.executor import ApiExecutor
+from aioarango.exceptions import AsyncModeError
+from aioarango.executor import ApiExecutor, AsyncApiExecutor
+from aioarango.job import AsyncJob
 from aioarango.request import Request
 from aioarango.response import Response
 from aioarango.result import Result
@@ -16,6 +18,8 @@ class ApiGroup:
     :param executor: API executor.
     """
 
+    __slots__ = ["_conn", "_executor"]
+
     def __init__(self, connection: Connection, executor: ApiExecutor) -> None:
         self._conn = connection
         self._executor = executor
@@ -58,15 +62,42 @@ class ApiGroup:
         """
         return self._executor.context
 
-    async def _execute(
+    def _execute(
         self, request: Request, response_handler: Callable[[Response], T]
-    ) -> Result[T]:
+    ) -> Awaitable[Result[T]]:
         """Execute an API.
 
+        The executor coroutine is returned as is instead of being awaited in
+        another coroutine, which saves a frame on every API call.
+
+        :param request: HTTP request.
+        :type request: aioarango.request.Request
+        :param response_handler: HTTP response handler.
+        :type response_handler: callable
+        :return: Awaitable API execution result.
+        """
+        return self._executor.execute(request, response_handler)
+
+    async def _execute_async(
+        self, request: Request, response_handler: Callable[[Response], T]
+    ) -> AsyncJob[T]:
+        """Execute an API as a server-side async job, bypassing the executor.
+
+        The server queues the request and acknowledges it immediately. The
+        result is kept on the server until it is fetched via the returned job.
+        This is only allowed in the default execution context, since the job
+        would otherwise escape the async, batch or transaction context.
+
         :param request: HTTP request.
         :type request: aioarango.request.Request
         :param response_handler: HTTP response handler.
         :type response_handler: callable
-        :return: API execution result.
+        :return: Async job.
+        :rtype: aioarango.job.AsyncJob
+        :raise aioarango.exceptions.AsyncModeError: If not in the default
+            execution context.
         """
-        return await self._executor.execute(request, response_handler)
+        if self.context != "default":
+            raise AsyncModeError(f"async mode not supported in {self.context} context")
+        executor = AsyncApiExecutor(self._conn, return_result=True)
+        return await executor.execute(request, response_handler)
@@ -265,6 +265,7 @@ class AQL(ApiGroup):
         max_runtime: Optional[Number] = None,
         fill_block_cache: Optional[bool] = None,
         allow_dirty_read: bool = False,
+        prefetch: bool = False,
     ) -> Result[Cursor]:
         """Execute the query and return the result cursor.
 
@@ -359,6 +360,9 @@ class AQL(ApiGroup):
         :type fill_block_cache: bool
         :param allow_dirty_read: Allow reads from followers in a cluster.
         :type allow_dirty_read: bool | None
+        :param prefetch: If set to True, the result cursor requests the next
+            batch in the background while the current one is being consumed.
+        :type prefetch: bool
         :return: Result cursor.
         :rtype: aioarango.cursor.Cursor
         :raise aioarango.exceptions.AQLQueryExecuteError: If execute fails.
@@ -419,7 +423,7 @@ class AQL(ApiGroup):
         def response_handler(resp: Response) -> Cursor:
             if not resp.is_success:
                 raise AQLQueryExecuteError(resp, request)
-            return Cursor(self._conn, resp.body)
+            return Cursor(self._conn, resp.body, prefetch=prefetch)
 
         return await self._execute(request, response_handler)
 
@@ -1,4 +1,4 @@
-from json import dumps, loads
+import json
 from typing import Any, Callable, Optional, Sequence, Union
 
 from pkg_resources import get_distribution
@@ -19,6 +19,45 @@ from aioarango.resolver import (
     SingleHostResolver,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def default_serializer(obj: Any) -> Union[str, bytes]:
+    """Serialize the given object with orjson if available, else json.
+
+    orjson output is returned as UTF-8 encoded bytes, which are sent as is
+    without being decoded and re-encoded. numpy arrays are serialized
+    natively. Objects orjson cannot handle (e.g. dicts with non-string keys)
+    fall back to ``json.dumps``.
+
+    :param obj: JSON object to serialize.
+    :type obj: str | bool | int | float | list | dict | None
+    :return: Serialized string or UTF-8 encoded bytes.
+    :rtype: str | bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return json.dumps(obj)
+
+
+def default_deserializer(string: str) -> Any:
+    """De-serialize the string with orjson if available, else json.
+
+    :param string: String to de-serialize.
+    :type string: str
+    :return: De-serialized JSON object.
+    :rtype: str | bool | int | float | list | dict | None
+    """
+    if orjson is not None:
+        return orjson.loads(string)
+    return json.loads(string)
+
 
 class ArangoClient:
     """ArangoDB client.
@@ -37,12 +76,14 @@ class ArangoClient:
     :type http_client: aioarango.http.HTTPClient
     :param serializer: User-defined JSON serializer. Must be a callable
         which takes a JSON data type object as its only argument and return
-        the serialized string. If not given, ``json.dumps`` is used by default.
+        the serialized string (or UTF-8 encoded bytes). If not given,
+        ``orjson.dumps`` is used if orjson is installed, otherwise
+        ``json.dumps``.
     :type serializer: callable
     :param deserializer: User-defined JSON de-serializer. Must be a callable
         which takes a JSON serialized string as its only argument and return
-        the de-serialized object. If not given, ``json.loads`` is used by
-        default.
+        the de-serialized object. If not given, ``orjson.loads`` is used if
+        orjson is installed, otherwise ``json.loads``.
     :type deserializer: callable
     :param verify_override: Override TLS certificate verification. This will
        override the verify method of the underlying HTTP client.
@@ -57,6 +98,21 @@ class ArangoClient:
        None: No timeout.
        int: Timeout value in seconds.
     :type request_timeout: Any
+    :param pool_size: Max number of pooled (and kept alive) connections in
+       each session of the default HTTP client. The limit is enforced by the
+       session as a whole (``httpx.Limits(max_connections=...)``), and one
+       session is created per host, so the client may open up to
+       **pool_size** times the number of hosts connections in total. Used
+       only if the parameter http_client is not specified. The default value
+       is 100. Larger pools let concurrent requests use separate connections
+       instead of queueing on a few, which mostly pays off over non-local
+       networks.
+    :type pool_size: int
+    :param http2: Negotiate HTTP/2 with the default HTTP client, so that
+       concurrent requests share one connection per host as separate
+       streams. Used only if the parameter http_client is not specified.
+       Requires the h2 package (``pip install aioarango[http2]``).
+    :type http2: bool
     """
 
     def __init__(
@@ -65,11 +121,13 @@ class ArangoClient:
         host_resolver: str = "roundrobin",
         resolver_max_tries: Optional[int] = None,
         http_client: Optional[HTTPClient] = None,
-        serializer: Callable[..., str] = lambda x: dumps(x),
-        deserializer: Callable[[str], Any] = lambda x: loads(x),
+        serializer: Callable[..., Union[str, bytes]] = default_serializer,
+        deserializer: Callable[[str], Any] = default_deserializer,
         verify_override: Union[bool, str, None] = None,
         request_timeout: Any = 60,
         verify_ssl: bool = True,
+        pool_size: int = 100,
+        http2: bool = False,
     ) -> None:
         if isinstance(hosts, str):
             self._hosts = [host.strip("/") for host in hosts.split(",")]
@@ -92,6 +150,8 @@ class ArangoClient:
         # This call can only happen AFTER initializing the http client.
         if http_client is None:
             self.request_timeout = request_timeout
+            self._http.POOL_SIZE = pool_size  # type: ignore
+            self._http.HTTP2 = http2  # type: ignore
 
         self._serializer = serializer
         self._deserializer = deserializer
@@ -142,6 +202,16 @@ class ArangoClient:
     def request_timeout(self, value: Any) -> None:
         self._http.REQUEST_TIMEOUT = value  # type: ignore
 
+    @property
+    def pool_size(self) -> Optional[int]:
+        """Return the connection pool size of the http client.
+
+        :return: Connection pool size, or None if the http client does not
+            define one.
+        :rtype: int | None
+        """
+        return getattr(self._http, "POOL_SIZE", None)
+
     async def db(
         self,
         name: str = "_system",
@@ -1,5 +1,17 @@
+import asyncio
+from functools import partial
 from numbers import Number
-from typing import List, Optional, Sequence, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from aioarango.api import ApiGroup
 from aioarango.connection import Connection
@@ -37,11 +49,244 @@ from aioarango.exceptions import (
 
 from aioarango.executor import ApiExecutor
 from aioarango.formatter import format_collection, format_edge, format_index, format_vertex
+from aioarango.job import AsyncJob
 from aioarango.request import Request
 from aioarango.response import Response
 from aioarango.result import Result
 from aioarango.typings import Fields, Headers, Json, Params
-from aioarango.utils import get_batches, get_doc_id, is_none_or_int, is_none_or_str
+from aioarango.utils import (
+    get_batches,
+    get_doc_id,
+    is_none_or_int,
+    is_none_or_str,
+    is_number,
+)
+
+# Collection statistics fields renamed to snake case in statistics().
+_STAT_RENAMES = {
+    "documentReferences": "document_refs",
+    "lastTick": "last_tick",
+    "waitingFor": "waiting_for",
+    "documentsSize": "documents_size",
+    "cacheInUse": "cache_in_use",
+    "cacheSize": "cache_size",
+    "cacheUsage": "cache_usage",
+    "uncollectedLogfileEntries": "uncollected_logfile_entries",
+}
+
+# Shared by read requests with allow_dirty_read set. Request copies the given
+# headers into its own dict, so this one is never mutated.
+_DIRTY_READ_HEADERS: Headers = {"x-arango-allow-dirty-read": "true"}
+
+# Shared by document requests without revision checks; never mutated either.
+_NO_HEADERS: Headers = {}
+
+# Endpoint prefix of single document requests, followed by the document ID.
+_DOC_PREFIX = "/_api/document/"
+
+# Bulk document errors reported as DocumentRevisionError, by error code.
+_REVISION_ERRORS: Dict[int, Type[ArangoServerError]] = {
+    1200: DocumentRevisionError,
+}
+
+# Pre-serialized document payloads accepted by insert_many and import_bulk.
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+
+T = TypeVar("T")
+
+
+def _compact(data: Json) -> Json:
+    """Return a copy of the request data without fields set to None.
+
+    :param data: Request data.
+    :type data: dict
+    :return: Request data with only the fields that are set.
+    :rtype: dict
+    """
+    return {k: v for k, v in data.items() if v is not None}
+
+
+def _graph_get_response_handler(
+        field: str, request: Request, resp: Response
+) -> Optional[Json]:
+    """Return the vertex or edge of a graph get response.
+
+    :param field: Response body field holding the document ("vertex" or
+        "edge").
+    :type field: str
+    :param request: HTTP request.
+    :type request: aioarango.request.Request
+    :param resp: HTTP response.
+    :type resp: aioarango.response.Response
+    :return: Document, or None if not found.
+    :rtype: dict | None
+    :raise aioarango.exceptions.DocumentGetError: If retrieval fails.
+    :raise aioarango.exceptions.DocumentRevisionError: If revisions mismatch.
+    """
+    if resp.error_code == 1202:
+        return None
+    if resp.status_code == 412:  # pragma: no cover
+        raise DocumentRevisionError(resp, request)
+    if not resp.is_success:
+        raise DocumentGetError(resp, request)
+    result: Json = resp.body[field]
+    return result
+
+
+def _graph_write_response_handler(
+        error_type: Type[ArangoServerError],
+        formatter: Callable[[Json], Json],
+        silent: bool,
+        request: Request,
+        resp: Response,
+) -> Union[bool, Json]:
+    """Return the metadata of a graph insert, update or replace response.
+
+    :param error_type: Exception raised if the operation fails.
+    :type error_type: type
+    :param formatter: Formatter for the response body (format_vertex or
+        format_edge).
+    :type formatter: callable
+    :param silent: Operation was run in silent mode.
+    :type silent: bool
+    :param request: HTTP request.
+    :type request: aioarango.request.Request
+    :param resp: HTTP response.
+    :type resp: aioarango.response.Response
+    :return: Document metadata, or True if **silent** was set to True.
+    :rtype: bool | dict
+    :raise aioarango.exceptions.DocumentRevisionError: If revisions mismatch.
+    """
+    if resp.status_code == 412:  # pragma: no cover
+        raise DocumentRevisionError(resp, request)
+    if not resp.is_success:
+        raise error_type(resp, request)
+    if silent is True:
+        return True
+    return formatter(resp.body)
+
+
+def _graph_delete_response_handler(
+        ignore_missing: bool, return_old: bool, request: Request, resp: Response
+) -> Union[bool, Json]:
+    """Return the result of a graph delete response.
+
+    :param ignore_missing: Return False instead of raising an exception if
+        the document is missing.
+    :type ignore_missing: bool
+    :param return_old: Return the old document.
+    :type return_old: bool
+    :param request: HTTP request.
+    :type request: aioarango.request.Request
+    :param resp: HTTP response.
+    :type resp: aioarango.response.Response
+    :return: True if deleted, False if missing and **ignore_missing** was
+        set to True, or the old document if **return_old** was set to True.
+    :rtype: bool | dict
+    :raise aioarango.exceptions.DocumentDeleteError: If delete fails.
+    :raise aioarango.exceptions.DocumentRevisionError: If revisions mismatch.
+    """
+    if resp.error_code == 1202 and ignore_missing:
+        return False
+    if resp.status_code == 412:  # pragma: no cover
+        raise DocumentRevisionError(resp, request)
+    if not resp.is_success:
+        raise DocumentDeleteError(resp, request)
+    result: Json = resp.body
+    return {"old": result["old"]} if return_old else True
+
+
+def _edge_list_response_handler(request: Request, resp: Response) -> Json:
+    """Return the edges and statistics of an edge list response.
+
+    :param request: HTTP request.
+    :type request: aioarango.request.Request
+    :param resp: HTTP response.
+    :type resp: aioarango.response.Response
+    :return: List of edges and statistics.
+    :rtype: dict
+    :raise aioarango.exceptions.EdgeListError: If retrieval fails.
+    """
+    if not resp.is_success:
+        raise EdgeListError(resp, request)
+    body: Json = resp.body
+    stats = body["stats"]
+    return {
+        "edges": body["edges"],
+        "stats": {
+            "filtered": stats["filtered"],
+            "scanned_index": stats["scannedIndex"],
+        },
+    }
+
+
+# Max number of document IDs cached per collection by _id_for_key(). Once
+# full, further keys are not cached, so streams of unique keys pay only a
+# failed lookup per document.
+_ID_CACHE_SIZE = 1024
+
+# AQL queries used by the simple query methods, one per query shape.
+_NEAR_QUERY = """
+FOR doc IN NEAR(@collection, @latitude, @longitude)
+    RETURN doc
+"""
+_NEAR_LIMIT_QUERY = """
+FOR doc IN NEAR(@collection, @latitude, @longitude, @limit)
+    RETURN doc
+"""
+_RANGE_QUERY = """
+FOR doc IN @@collection
+    FILTER doc.@field >= @lower && doc.@field < @upper
+    LIMIT @skip, @limit
+    RETURN doc
+"""
+_RANGE_NO_LIMIT_QUERY = """
+FOR doc IN @@collection
+    FILTER doc.@field >= @lower && doc.@field < @upper
+    RETURN doc
+"""
+_RADIUS_QUERY = """
+FOR doc IN WITHIN(@@collection, @latitude, @longitude, @radius)
+    RETURN doc
+"""
+_RADIUS_DISTANCE_QUERY = """
+FOR doc IN WITHIN(@@collection, @latitude, @longitude, @radius, @distance)
+    RETURN doc
+"""
+_GEO_RADIUS_QUERY = """
+FOR doc IN @@collection
+    FILTER GEO_DISTANCE([@longitude, @latitude], doc.@field) <= @radius
+    SORT GEO_DISTANCE([@longitude, @latitude], doc.@field)
+    RETURN doc
+"""
+_GEO_RADIUS_DISTANCE_QUERY = """
+FOR doc IN @@collection
+    LET dist = GEO_DISTANCE([@longitude, @latitude], doc.@field)
+    FILTER dist <= @radius
+    SORT dist
+    RETURN MERGE(doc, {[@distance]: dist})
+"""
+_SEARCH_QUERY = """
+FOR doc IN @@view
+    SEARCH ANALYZER(doc.@field IN TOKENS(@query, @analyzer), @analyzer)
+    OPTIONS {collections: [@collection]}
+    RETURN doc
+"""
+_SEARCH_LIMIT_QUERY = """
+FOR doc IN @@view
+    SEARCH ANALYZER(doc.@field IN TOKENS(@query, @analyzer), @analyzer)
+    OPTIONS {collections: [@collection]}
+    LIMIT @limit
+    RETURN doc
+"""
+_FULLTEXT_QUERY = """
+FOR doc IN FULLTEXT(@collection, @field, @query)
+    RETURN doc
+"""
+_FULLTEXT_LIMIT_QUERY = """
+FOR doc IN FULLTEXT(@collection, @field, @query, @limit)
+    RETURN doc
+"""
 
 
 class Collection(ApiGroup):
@@ -52,6 +297,15 @@ class Collection(ApiGroup):
     :param name: Collection name.
     """
 
+    __slots__ = [
+        "_name",
+        "_id_prefix",
+        "_coll_endpoint",
+        "_doc_endpoint",
+        "_index_prefix",
+        "_id_cache",
+    ]
+
     types = {2: "document", 3: "edge"}
 
     statuses = {
@@ -67,8 +321,8 @@ class Collection(ApiGroup):
             self, connection: Connection, executor: ApiExecutor, name: str
     ) -> None:
         super().__init__(connection, executor)
-        self._name = name
-        self._id_prefix = name + "/"
+        self._id_cache: Dict[str, str] = {}
+        self._set_name(name)
 
     # def __iter__(self) -> Result[Cursor]:
     #     return self.all()
@@ -89,6 +343,19 @@ class Collection(ApiGroup):
         """
         return None if code is None else self.statuses[code]
 
+    def _set_name(self, name: str) -> None:
+        """Set the collection name and the values derived from it.
+
+        :param name: Collection name.
+        :type name: str
+        """
+        self._name = name
+        self._id_prefix = name + "/"
+        self._coll_endpoint = "/_api/collection/" + name
+        self._doc_endpoint = "/_api/document/" + name
+        self._index_prefix = "/_api/index/" + name + "/"
+        self._id_cache.clear()
+
     def _validate_id(self, doc_id: str) -> str:
         """Check the collection name in the document ID.
 
@@ -102,6 +369,24 @@ class Collection(ApiGroup):
             raise DocumentParseError(f'bad collection name in document ID "{doc_id}"')
         return doc_id
 
+    def _id_for_key(self, key: str) -> str:
+        """Return the document ID for the given document key.
+
+        IDs are cached so that repeated keys (e.g. across bulk batches) reuse
+        the same string instead of building a new one each time.
+
+        :param key: Document key.
+        :type key: str
+        :return: Document ID.
+        :rtype: str
+        """
+        doc_id = self._id_cache.get(key)
+        if doc_id is None:
+            doc_id = self._id_prefix + key
+            if len(self._id_cache) < _ID_CACHE_SIZE:
+                self._id_cache[key] = doc_id
+        return doc_id
+
     def _extract_id(self, body: Json) -> str:
         """Extract the document ID from document body.
 
@@ -111,14 +396,18 @@ class Collection(ApiGroup):
         :rtype: str
         :raise aioarango.exceptions.DocumentParseError: On missing ID and key.
         """
-        try:
-            if "_id" in body:
-                return self._validate_id(body["_id"])
-            else:
-                key: str = body["_key"]
-                return self._id_prefix + key
-        except KeyError:
+        doc_id: Optional[str] = body.get("_id")
+        if doc_id is not None:
+            if not doc_id.startswith(self._id_prefix):
+                raise DocumentParseError(
+                    f'bad collection name in document ID "{doc_id}"'
+                )
+            return doc_id
+
+        key: Optional[str] = body.get("_key")
+        if key is None:
             raise DocumentParseError('field "_key" or "_id" required')
+        return self._id_for_key(key)
 
     def _prep_from_body(self, document: Json, check_rev: bool) -> Tuple[str, Headers]:
         """Prepare document ID and request headers.
@@ -131,9 +420,9 @@ class Collection(ApiGroup):
         :rtype: (str, dict)
         """
         doc_id = self._extract_id(document)
-        if not check_rev or "_rev" not in document:
-            return doc_id, {}
-        return doc_id, {"If-Match": document["_rev"]}
+        if check_rev and "_rev" in document:
+            return doc_id, {"If-Match": document["_rev"]}
+        return doc_id, _NO_HEADERS
 
     def _prep_from_doc(
             self, document: Union[str, Json], rev: Optional[str], check_rev: bool
@@ -152,27 +441,27 @@ class Collection(ApiGroup):
         if isinstance(document, dict):
             doc_id = self._extract_id(document)
             rev = rev or document.get("_rev")
-
-            if not check_rev or rev is None:
-                return doc_id, doc_id, {}
-            else:
-                return doc_id, doc_id, {"If-Match": rev}
+        elif document.startswith(self._id_prefix):
+            doc_id = document
+        elif "/" in document:
+            raise DocumentParseError(f'bad collection name in document ID "{document}"')
         else:
-            if "/" in document:
-                doc_id = self._validate_id(document)
-            else:
-                doc_id = self._id_prefix + document
+            doc_id = self._id_for_key(document)
 
-            if not check_rev or rev is None:
-                return doc_id, doc_id, {}
-            else:
-                return doc_id, doc_id, {"If-Match": rev}
+        # The headers returned may be shared, so callers must not modify them.
+        if check_rev and rev is not None:
+            return doc_id, doc_id, {"If-Match": rev}
+        return doc_id, doc_id, _NO_HEADERS
 
-    def _ensure_key_in_body(self, body: Json) -> Json:
+    def _ensure_key_in_body(self, body: Json, *, copy: bool = True) -> Json:
         """Return the document body with "_key" field populated.
 
         :param body: Document body.
         :type body: dict
+        :param copy: Copy the body before adding the "_key" field. Only set
+            this to False if the caller owns the body and does not mind it
+            being modified in place.
+        :type copy: bool
         :return: Document body with "_key" field.
         :rtype: dict
         :raise aioarango.exceptions.DocumentParseError: On missing ID and key.
@@ -180,26 +469,146 @@ class Collection(ApiGroup):
         if "_key" in body:
             return body
         elif "_id" in body:
-            doc_id = self._validate_id(body["_id"])
-            body = body.copy()
-            body["_key"] = doc_id[len(self._id_prefix):]
+            doc_id: str = body["_id"]
+            if not doc_id.startswith(self._id_prefix):
+                raise DocumentParseError(
+                    f'bad collection name in document ID "{doc_id}"'
+                )
+            if copy:
+                body = body.copy()
+            body["_key"] = doc_id.removeprefix(self._id_prefix)
             return body
         raise DocumentParseError('field "_key" or "_id" required')
 
-    def _ensure_key_from_id(self, body: Json) -> Json:
+    def _ensure_key_from_id(self, body: Json, *, copy: bool = True) -> Json:
         """Return the body with "_key" field if it has "_id" field.
 
         :param body: Document body.
         :type body: dict
+        :param copy: Copy the body before adding the "_key" field. Only set
+            this to False if the caller owns the body and does not mind it
+            being modified in place.
+        :type copy: bool
         :return: Document body with "_key" field if it has "_id" field.
         :rtype: dict
         """
         if "_id" in body and "_key" not in body:
-            doc_id = self._validate_id(body["_id"])
-            body = body.copy()
-            body["_key"] = doc_id[len(self._id_prefix):]
+            doc_id: str = body["_id"]
+            if not doc_id.startswith(self._id_prefix):
+                raise DocumentParseError(
+                    f'bad collection name in document ID "{doc_id}"'
+                )
+            if copy:
+                body = body.copy()
+            body["_key"] = doc_id.removeprefix(self._id_prefix)
         return body
 
+    async def _execute_many(
+            self,
+            requests: Sequence[Request],
+            response_handler: Callable[[Request, Response], T],
+            max_in_flight: Optional[int] = None,
+    ) -> List[Result[T]]:
+        """Execute multiple API requests concurrently.
+
+        By default, at most as many requests as the connection pool size are
+        in flight at once (one at a time if the pool size is unknown). Requests
+        in transactions are always executed one at a time. If a request fails,
+        the requests not yet finished are cancelled and waited for before the
+        error is raised.
+
+        :param requests: HTTP requests.
+        :type requests: [aioarango.request.Request]
+        :param response_handler: HTTP response handler, called with the
+            request and its response.
+        :type response_handler: callable
+        :param max_in_flight: Max number of requests in flight at once.
+        :type max_in_flight: int | None
+        :return: API execution results, in the order of **requests**.
+        :rtype: list
+        """
+        if self.context == "transaction":
+            limit = 1
+        else:
+            limit = max_in_flight or self._conn.pool_size or 1
+        semaphore = asyncio.Semaphore(limit)
+
+        async def execute(request: Request) -> Result[T]:
+            async with semaphore:
+                return await self._execute(request, partial(response_handler, request))
+
+        tasks = [asyncio.ensure_future(execute(request)) for request in requests]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancellations, and retrieve the exceptions of any
+            # other failed requests, before re-raising the first failure.
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _cursor_response_handler(self, request: Request, resp: Response) -> Cursor:
+        """Return a cursor over the documents of a query response.
+
+        :param request: HTTP request.
+        :type request: aioarango.request.Request
+        :param resp: HTTP response.
+        :type resp: aioarango.response.Response
+        :return: Document cursor.
+        :rtype: aioarango.cursor.Cursor
+        :raise aioarango.exceptions.DocumentGetError: If retrieval failed.
+        """
+        if not resp.is_success:
+            raise DocumentGetError(resp, request)
+        return Cursor(self._conn, resp.body)
+
+    def _bulk_response_handler(
+            self,
+            error_type: Type[ArangoServerError],
+            error_types: Dict[int, Type[ArangoServerError]],
+            silent: bool,
+            request: Request,
+            resp: Response,
+    ) -> Union[bool, List[Union[Json, ArangoServerError]]]:
+        """Return the results of a bulk document operation.
+
+        :param error_type: Exception raised if the operation fails, and
+            returned for documents that failed.
+        :type error_type: type
+        :param error_types: Exceptions returned instead of **error_type**
+            for documents that failed with the given error codes.
+        :type error_types: dict
+        :param silent: Operation was run in silent mode.
+        :type silent: bool
+        :param request: HTTP request.
+        :type request: aioarango.request.Request
+        :param resp: HTTP response.
+        :type resp: aioarango.response.Response
+        :return: List of document metadata and exceptions, or True if
+            **silent** was set to True.
+        :rtype: [dict | ArangoServerError] | bool
+        """
+        if not resp.is_success:
+            raise error_type(resp, request)
+        if silent is True:
+            return True
+
+        results: List[Union[Json, ArangoServerError]] = []
+        append = results.append
+        for body in resp.body:
+            if "_id" in body:
+                old_rev = body.pop("_oldRev", None)
+                if old_rev is not None:
+                    body["_old_rev"] = old_rev
+                append(body)
+            else:
+                sub_resp = self._conn.prep_bulk_err_response(resp, body)
+                error = error_types.get(sub_resp.error_code, error_type)
+                append(error(sub_resp, request))
+
+        return results
+
     @property
     def name(self) -> str:
         """Return collection name.
@@ -209,16 +618,24 @@ class Collection(ApiGroup):
         """
         return self._name
 
-    async def recalculate_count(self) -> Result[bool]:
+    async def recalculate_count(
+            self, async_mode: bool = False
+    ) -> Result[Union[bool, AsyncJob[bool]]]:
         """Recalculate the document count.
 
-        :return: True if recalculation was successful.
-        :rtype: bool
+        :param async_mode: Run the operation as a server-side async job.
+        :type async_mode: bool
+        :return: True if recalculation was successful, or an async job
+            if **async_mode** was set to True.
+        :rtype: bool | aioarango.job.AsyncJob
         :raise aioarango.exceptions.CollectionRecalculateCountError: If operation fails.
+        :raise aioarango.exceptions.AsyncModeError: If **async_mode** is set
+            outside the default execution context.
         """
         request = Request(
             method="put",
-            endpoint=f"/_api/collection/{self.name}/recalculateCount",
+            endpoint=self._coll_endpoint + "/recalculateCount",
+            parse_body=False,
         )
 
         def response_handler(resp: Response) -> bool:
@@ -226,6 +643,8 @@ class Collection(ApiGroup):
                 return True
             raise CollectionRecalculateCountError(resp, request)
 
+        if async_mode:
+            return await self._execute_async(request, response_handler)
         return await self._execute(request, response_handler)
 
     async def responsible_shard(self, document: Json) -> Result[str]:  # pragma: no cover
@@ -239,7 +658,7 @@ class Collection(ApiGroup):
         """
         request = Request(
             method="put",
-            endpoint=f"/_api/collection/{self.name}/responsibleShard",
+            endpoint=self._coll_endpoint + "/responsibleShard",
             data=document,
             read=self.name,
         )
@@ -266,15 +685,15 @@ class Collection(ApiGroup):
         """
         request = Request(
             method="put",
-            endpoint=f"/_api/collection/{self.name}/rename",
+            endpoint=self._coll_endpoint + "/rename",
             data={"name": new_name},
+            parse_body=False,
         )
 
         def response_handler(resp: Response) -> bool:
             if not resp.is_success:
                 raise CollectionRenameError(resp, request)
-            self._name = new_name
-            self._id_prefix = new_name + "/"
+            self._set_name(new_name)
             return True
 
         return await self._execute(request, response_handler)
@@ -288,7 +707,7 @@ class Collection(ApiGroup):
         """
         request = Request(
             method="get",
-            endpoint=f"/_api/collection/{self.name}/properties",
+            endpoint=self._coll_endpoint + "/properties",
             read=self.name,
         )
 
@@ -303,7 +722,8 @@ class Collection(ApiGroup):
             self, sync: Optional[bool] = None, schema: Optional[Json] = None,
             replication_factor: Optional[int] = None,
             write_concern: Optional[int] = None,
-    ) -> Result[Json]:
+            async_mode: bool = False,
+    ) -> Result[Union[Json, AsyncJob[Json]]]:
         """Configure collection properties.
 
         :param sync: Block until operations are synchronized to disk.
@@ -325,9 +745,14 @@ class Collection(ApiGroup):
             parameter cannot be larger than that of **replication_factor**.
             Default value is 1. Used for clusters only.
         :type write_concern: int
-        :return: New collection properties.
-        :rtype: dict
+        :param async_mode: Run the operation as a server-side async job.
+        :type async_mode: bool
+        :return: New collection properties, or an async job if
+            **async_mode** was set to True.
+        :rtype: dict | aioarango.job.AsyncJob
         :raise aioarango.exceptions.CollectionConfigureError: If operation fails.
+        :raise aioarango.exceptions.AsyncModeError: If **async_mode** is set
+            outside the default execution context.
         """
         data: Json = {}
         if sync is not None:
@@ -341,7 +766,7 @@ class Collection(ApiGroup):
 
         request = Request(
             method="put",
-            endpoint=f"/_api/collection/{self.name}/properties",
+            endpoint=self._coll_endpoint + "/properties",
             data=data,
         )
 
@@ -350,6 +775,8 @@ class Collection(ApiGroup):
                 raise CollectionConfigureError(resp, request)
             return format_collection(resp.body)
 
+        if async_mode:
+            return await self._execute_async(request, response_handler)
         return await self._execute(request, response_handler)
 
     async def statistics(self) -> Result[Json]:
@@ -361,7 +788,7 @@ class Collection(ApiGroup):
         """
         request = Request(
             method="get",
-            endpoint=f"/_api/collection/{self.name}/figures",
+            endpoint=self._coll_endpoint + "/figures",
             read=self.name,
         )
 
@@ -370,25 +797,7 @@ class Collection(ApiGroup):
                 raise CollectionStatisticsError(resp, request)
 
             stats: Json = resp.body.get("figures", resp.body)
-            if "documentReferences" in stats:  # pragma: no cover
-                stats["document_refs"] = stats.pop("documentReferences")
-            if "lastTick" in stats:  # pragma: no cover
-                stats["last_tick"] = stats.pop("lastTick")
-            if "waitingFor" in stats:  # pragma: no cover
-                stats["waiting_for"] = stats.pop("waitingFor")
-            if "documentsSize" in stats:  # pragma: no cover
-                stats["documents_size"] = stats.pop("documentsSize")
-            if "cacheInUse" in stats:  # pragma: no cover
-                stats["cache_in_use"] = stats.pop("cacheInUse")
-            if "cacheSize" in stats:  # pragma: no cover
-                stats["cache_size"] = stats.pop("cacheSize")
-            if "cacheUsage" in stats:  # pragma: no cover
-                stats["cache_usage"] = stats.pop("cacheUsage")
-            if "uncollectedLogfileEntries" in stats:  # pragma: no cover
-                stats["uncollected_logfile_entries"] = stats.pop(
-                    "uncollectedLogfileEntries"
-                )
-            return stats
+            return {_STAT_RENAMES.get(k, k): v for k, v in stats.items()}
 
         return await self._execute(request, response_handler)
 
@@ -401,7 +810,7 @@ class Collection(ApiGroup):
         """
         request = Request(
             method="get",
-            endpoint=f"/_api/collection/{self.name}/revision",
+            endpoint=self._coll_endpoint + "/revision",
             read=self.name,
         )
 
@@ -425,8 +834,11 @@ class Collection(ApiGroup):
         """
         request = Request(
             method="get",
-            endpoint=f"/_api/collection/{self.name}/checksum",
-            params={"withRevision": with_rev, "withData": with_data},
+            endpoint=self._coll_endpoint + "/checksum",
+            params={
+                "withRevision": "1" if with_rev else "0",
+                "withData": "1" if with_data else "0",
+            },
         )
 
         def response_handler(resp: Response) -> str:
@@ -436,47 +848,76 @@ class Collection(ApiGroup):
 
         return await self._execute(request, response_handler)
 
-    async def load(self) -> Result[bool]:
+    async def load(
+            self, async_mode: bool = False
+    ) -> Result[Union[bool, AsyncJob[bool]]]:
         """Load the collection into memory.
 
-        :return: True if collection was loaded successfully.
-        :rtype: bool
+        :param async_mode: Run the operation as a server-side async job.
+        :type async_mode: bool
+        :return: True if collection was loaded successfully, or an async
+            job if **async_mode** was set to True.
+        :rtype: bool | aioarango.job.AsyncJob
         :raise aioarango.exceptions.CollectionLoadError: If operation fails.
+        :raise aioarango.exceptions.AsyncModeError: If **async_mode** is set
+            outside the default execution context.
         """
-        request = Request(method="put", endpoint=f"/_api/collection/{self.name}/load")
+        request = Request(
+            method="put", endpoint=self._coll_endpoint + "/load", parse_body=False
+        )
 
         def response_handler(resp: Response) -> bool:
             if not resp.is_success:
                 raise CollectionLoadError(resp, request)
             return True
 
+        if async_mode:
+            return await self._execute_async(request, response_handler)
         return await self._execute(request, response_handler)
 
-    async def unload(self) -> Result[bool]:
+    async def unload(
+            self, async_mode: bool = False
+    ) -> Result[Union[bool, AsyncJob[bool]]]:
         """Unload the collection from memory.
 
-        :return: True if collection was unloaded successfully.
-        :rtype: bool
+        :param async_mode: Run the operation as a server-side async job.
+        :type async_mode: bool
+        :return: True if collection was unloaded successfully, or an async
+            job if **async_mode** was set to True.
+        :rtype: bool | aioarango.job.AsyncJob
         :raise aioarango.exceptions.CollectionUnloadError: If operation fails.
+        :raise aioarango.exceptions.AsyncModeError: If **async_mode** is set
+            outside the default execution context.
         """
-        request = Request(method="put", endpoint=f"/_api/collection/{self.name}/unload")
+        request = Request(
+            method="put", endpoint=self._coll_endpoint + "/unload", parse_body=False
+        )
 
         def response_handler(resp: Response) -> bool:
             if not resp.is_success:
                 raise CollectionUnloadError(resp, request)
             return True
 
+        if async_mode:
+            return await self._execute_async(request, response_handler)
         return await self._execute(request, response_handler)
 
-    async def truncate(self) -> Result[bool]:
+    async def truncate(
+            self, async_mode: bool = False
+    ) -> Result[Union[bool, AsyncJob[bool]]]:
         """Delete all documents in the collection.
 
-        :return: True if collection was truncated successfully.
-        :rtype: bool
+        :param async_mode: Run the operation as a server-side async job.
+        :type async_mode: bool
+        :return: True if collection was truncated successfully, or an async
+            job if **async_mode** was set to True.
+        :rtype: bool | aioarango.job.AsyncJob
         :raise aioarango.exceptions.CollectionTruncateError: If operation fails.
+        :raise aioarango.exceptions.AsyncModeError: If **async_mode** is set
+            outside the default execution context.
         """
         request = Request(
-            method="put", endpoint=f"/_api/collection/{self.name}/truncate"
+            method="put", endpoint=self._coll_endpoint + "/truncate", parse_body=False
         )
 
         def response_handler(resp: Response) -> bool:
@@ -484,6 +925,8 @@ class Collection(ApiGroup):
                 raise CollectionTruncateError(resp, request)
             return True
 
+        if async_mode:
+            return await self._execute_async(request, response_handler)
         return await self._execute(request, response_handler)
 
     async def count(self) -> Result[int]:
@@ -493,7 +936,7 @@ class Collection(ApiGroup):
         :rtype: int
         :raise aioarango.exceptions.DocumentCountError: If retrieval fails.
         """
-        request = Request(method="get", endpoint=f"/_api/collection/{self.name}/count")
+        request = Request(method="get", endpoint=self._coll_endpoint + "/count")
 
         def response_handler(resp: Response) -> int:
             if resp.is_success:
@@ -531,11 +974,11 @@ class Collection(ApiGroup):
         handle, body, headers = self._prep_from_doc(document, rev, check_rev)
 
         if allow_dirty_read:
-            headers["x-arango-allow-dirty-read"] = "true"
+            headers = {**headers, **_DIRTY_READ_HEADERS}
 
         request = Request(
             method="get",
-            endpoint=f"/_api/document/{handle}",
+            endpoint=_DOC_PREFIX + handle,
             headers=headers,
             read=self.name,
         )
@@ -551,6 +994,59 @@ class Collection(ApiGroup):
 
         return await self._execute(request, response_handler)
 
+    async def has_many(
+            self, documents: Sequence[Union[str, Json]], allow_dirty_read: bool = False,
+    ) -> Result[List[bool]]:
+        """Check if multiple documents exist in the collection.
+
+        All documents are checked in a single request instead of one request
+        per document.
+
+        :param documents: List of document keys, IDs or bodies. Document bodies
+            must contain the "_id" or "_key" fields.
+        :type documents: [str | dict]
+        :param allow_dirty_read: Allow reads from followers in a cluster.
+        :type allow_dirty_read: bool | None
+        :return: List of booleans in the same order as **documents**. True if
+            the corresponding document exists, False otherwise.
+        :rtype: [bool]
+        :raise aioarango.exceptions.DocumentInError: If check fails, including
+            for any document that fails with an error other than not found.
+        """
+        # Plain lists of keys or IDs (the common case) are sent as they are.
+        if all(type(d) is str for d in documents):
+            handles = list(documents)
+        else:
+            extract_id = self._extract_id
+            handles = [extract_id(d) if isinstance(d, dict) else d for d in documents]
+
+        request = Request(
+            method="put",
+            endpoint=self._doc_endpoint,
+            params={"onlyget": "1"},
+            data=handles,
+            read=self.name,
+            headers=_DIRTY_READ_HEADERS if allow_dirty_read else None,
+        )
+
+        def response_handler(resp: Response) -> List[bool]:
+            if not resp.is_success:
+                raise DocumentInError(resp, request)
+
+            results: List[bool] = []
+            for doc in resp.body:
+                if "_id" in doc:
+                    results.append(True)
+                elif doc.get("errorNum") == 1202:
+                    results.append(False)
+                else:
+                    # Other errors (e.g. illegal handles) raise, like has() does.
+                    err_resp = self._conn.prep_bulk_err_response(resp, doc)
+                    raise DocumentInError(err_resp, request)
+            return results
+
+        return await self._execute(request, response_handler)
+
     async def ids(self) -> Result[Cursor]:
         """Return the IDs of all documents in the collection.
 
@@ -619,12 +1115,9 @@ class Collection(ApiGroup):
             method="put", endpoint="/_api/simple/all", data=data, read=self.name
         )
 
-        def response_handler(resp: Response) -> Cursor:
-            if not resp.is_success:
-                raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request, partial(self._cursor_response_handler, request)
+        )
 
     async def export(
             self,
@@ -718,15 +1211,21 @@ class Collection(ApiGroup):
             method="put", endpoint="/_api/simple/by-example", data=data, read=self.name
         )
 
-        def response_handler(resp: Response) -> Cursor:
-            if not resp.is_success:
-                raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request, partial(self._cursor_response_handler, request)
+        )
 
     async def find_near(
-            self, latitude: Number, longitude: Number, limit: Optional[int] = None, allow_dirty_read: bool = False,
+            self,
+            latitude: Number,
+            longitude: Number,
+            limit: Optional[int] = None,
+            allow_dirty_read: bool = False,
+            batch_size: Optional[int] = None,
+            ttl: Optional[Number] = None,
+            memory_limit: Optional[int] = None,
+            cache: Optional[bool] = None,
+            count: bool = True,
     ) -> Result[Cursor]:
         """Return documents near a given coordinate.
 
@@ -743,20 +1242,30 @@ class Collection(ApiGroup):
         :type limit: int | None
         :param allow_dirty_read: Allow reads from followers in a cluster.
         :type allow_dirty_read: bool | None
+        :param batch_size: Number of documents fetched by the cursor in one
+            round trip.
+        :type batch_size: int | None
+        :param ttl: Server side time-to-live for the cursor in seconds.
+        :type ttl: int | None
+        :param memory_limit: Max amount of memory the query is allowed to use
+            in bytes. Value 0 indicates no limit.
+        :type memory_limit: int | None
+        :param cache: If set to True, the query cache is used. The operation
+            mode of the query cache must be set to "on" or "demand".
+        :type cache: bool | None
+        :param count: If set to True, the total document count is included in
+            the result cursor. Set to False to spare the server from counting
+            the full result set before returning the first batch.
+        :type count: bool
         :returns: Document cursor.
         :rtype: aioarango.cursor.Cursor
         :raises aioarango.exceptions.DocumentGetError: If retrieval fails.
         """
-        assert isinstance(latitude, Number), "latitude must be a number"
-        assert isinstance(longitude, Number), "longitude must be a number"
+        assert is_number(latitude), "latitude must be a number"
+        assert is_number(longitude), "longitude must be a number"
         assert is_none_or_int(limit), "limit must be a non-negative int"
 
-        query = """
-        FOR doc IN NEAR(@collection, @latitude, @longitude{})
-            RETURN doc
-        """.format(
-            "" if limit is None else ", @limit "
-        )
+        query = _NEAR_QUERY if limit is None else _NEAR_LIMIT_QUERY
 
         bind_vars = {
             "collection": self._name,
@@ -769,17 +1278,22 @@ class Collection(ApiGroup):
         request = Request(
             method="post",
             endpoint="/_api/cursor",
-            data={"query": query, "bindVars": bind_vars, "count": True},
+            data=_compact({
+                "query": query,
+                "bindVars": bind_vars,
+                "count": count,
+                "batchSize": batch_size,
+                "ttl": ttl,
+                "memoryLimit": memory_limit,
+                "cache": cache,
+            }),
             read=self.name,
-            headers={"x-arango-allow-dirty-read": "true"} if allow_dirty_read else None,
+            headers=_DIRTY_READ_HEADERS if allow_dirty_read else None,
         )
 
-        def response_handler(resp: Response) -> Cursor:
-            if not resp.is_success:
-                raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request, partial(self._cursor_response_handler, request)
+        )
 
     async def find_in_range(
             self,
@@ -789,6 +1303,11 @@ class Collection(ApiGroup):
             skip: Optional[int] = None,
             limit: Optional[int] = None,
             allow_dirty_read: bool = False,
+            batch_size: Optional[int] = None,
+            ttl: Optional[Number] = None,
+            memory_limit: Optional[int] = None,
+            cache: Optional[bool] = None,
+            count: bool = True,
     ) -> Result[Cursor]:
         """Return documents within a given range in a random order.
 
@@ -806,6 +1325,21 @@ class Collection(ApiGroup):
         :type limit: int | None
         :param allow_dirty_read: Allow reads from followers in a cluster.
         :type allow_dirty_read: bool | None
+        :param batch_size: Number of documents fetched by the cursor in one
+            round trip.
+        :type batch_size: int | None
+        :param ttl: Server side time-to-live for the cursor in seconds.
+        :type ttl: int | None
+        :param memory_limit: Max amount of memory the query is allowed to use
+            in bytes. Value 0 indicates no limit.
+        :type memory_limit: int | None
+        :param cache: If set to True, the query cache is used. The operation
+            mode of the query cache must be set to "on" or "demand".
+        :type cache: bool | None
+        :param count: If set to True, the total document count is included in
+            the result cursor. Set to False to spare the server from counting
+            the full result set before returning the first batch.
+        :type count: bool
         :returns: Document cursor.
         :rtype: aioarango.cursor.Cursor
         :raises aioarango.exceptions.DocumentGetError: If retrieval fails.
@@ -818,31 +1352,33 @@ class Collection(ApiGroup):
             "field": field,
             "lower": lower,
             "upper": upper,
-            "skip": 0 if skip is None else skip,
-            "limit": 2147483647 if limit is None else limit,  # 2 ^ 31 - 1
         }
-
-        query = """
-        FOR doc IN @@collection
-            FILTER doc.@field >= @lower && doc.@field < @upper
-            LIMIT @skip, @limit
-            RETURN doc
-        """
+        if skip is None and limit is None:
+            query = _RANGE_NO_LIMIT_QUERY
+        else:
+            query = _RANGE_QUERY
+            bind_vars["skip"] = 0 if skip is None else skip
+            bind_vars["limit"] = 2147483647 if limit is None else limit  # 2 ^ 31 - 1
 
         request = Request(
             method="post",
             endpoint="/_api/cursor",
-            data={"query": query, "bindVars": bind_vars, "count": True},
+            data=_compact({
+                "query": query,
+                "bindVars": bind_vars,
+                "count": count,
+                "batchSize": batch_size,
+                "ttl": ttl,
+                "memoryLimit": memory_limit,
+                "cache": cache,
+            }),
             read=self.name,
-            headers={"x-arango-allow-dirty-read": "true"} if allow_dirty_read else None,
+            headers=_DIRTY_READ_HEADERS if allow_dirty_read else None,
         )
 
-        def response_handler(resp: Response) -> Cursor:
-            if not resp.is_success:
-                raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request, partial(self._cursor_response_handler, request)
+        )
 
     async def find_in_radius(
             self,
@@ -851,10 +1387,20 @@ class Collection(ApiGroup):
             radius: Number,
             distance_field: Optional[str] = None,
             allow_dirty_read: bool = False,
+            field: Optional[str] = None,
+            batch_size: Optional[int] = None,
+            ttl: Optional[Number] = None,
+            memory_limit: Optional[int] = None,
+            cache: Optional[bool] = None,
+            count: bool = True,
     ) -> Result[Cursor]:
         """Return documents within a given radius around a coordinate.
 
         A geo index must be defined in the collection to use this method.
+        If **field** is given, the distance is checked with GEO_DISTANCE
+        instead of the deprecated WITHIN function, which lets the query
+        optimizer use a GeoJSON geo index on that field. Results are sorted
+        by distance, nearest first, as with WITHIN.
 
         :param latitude: Latitude.
         :type latitude: int | float
@@ -867,21 +1413,33 @@ class Collection(ApiGroup):
         :type distance_field: str
         :param allow_dirty_read: Allow reads from followers in a cluster.
         :type allow_dirty_read: bool | None
+        :param field: Document field holding the location as a GeoJSON
+            object or a [longitude, latitude] pair.
+        :type field: str | None
+        :param batch_size: Number of documents fetched by the cursor in one
+            round trip.
+        :type batch_size: int | None
+        :param ttl: Server side time-to-live for the cursor in seconds.
+        :type ttl: int | None
+        :param memory_limit: Max amount of memory the query is allowed to use
+            in bytes. Value 0 indicates no limit.
+        :type memory_limit: int | None
+        :param cache: If set to True, the query cache is used. The operation
+            mode of the query cache must be set to "on" or "demand".
+        :type cache: bool | None
+        :param count: If set to True, the total document count is included in
+            the result cursor. Set to False to spare the server from counting
+            the full result set before returning the first batch.
+        :type count: bool
         :returns: Document cursor.
         :rtype: aioarango.cursor.Cursor
         :raises aioarango.exceptions.DocumentGetError: If retrieval fails.
         """
-        assert isinstance(latitude, Number), "latitude must be a number"
-        assert isinstance(longitude, Number), "longitude must be a number"
-        assert isinstance(radius, Number), "radius must be a number"
+        assert is_number(latitude), "latitude must be a number"
+        assert is_number(longitude), "longitude must be a number"
+        assert is_number(radius), "radius must be a number"
         assert is_none_or_str(distance_field), "distance_field must be a str"
-
-        query = """
-        FOR doc IN WITHIN(@@collection, @latitude, @longitude, @radius{})
-            RETURN doc
-        """.format(
-            "" if distance_field is None else ", @distance"
-        )
+        assert is_none_or_str(field), "field must be a str"
 
         bind_vars = {
             "@collection": self._name,
@@ -889,23 +1447,37 @@ class Collection(ApiGroup):
             "longitude": longitude,
             "radius": radius,
         }
+        if field is None:
+            query = _RADIUS_QUERY if distance_field is None else _RADIUS_DISTANCE_QUERY
+        else:
+            query = (
+                _GEO_RADIUS_QUERY
+                if distance_field is None
+                else _GEO_RADIUS_DISTANCE_QUERY
+            )
+            bind_vars["field"] = field
         if distance_field is not None:
             bind_vars["distance"] = distance_field
 
         request = Request(
             method="post",
             endpoint="/_api/cursor",
-            data={"query": query, "bindVars": bind_vars, "count": True},
+            data=_compact({
+                "query": query,
+                "bindVars": bind_vars,
+                "count": count,
+                "batchSize": batch_size,
+                "ttl": ttl,
+                "memoryLimit": memory_limit,
+                "cache": cache,
+            }),
             read=self.name,
-            headers={"x-arango-allow-dirty-read": "true"} if allow_dirty_read else None,
+            headers=_DIRTY_READ_HEADERS if allow_dirty_read else None,
         )
 
-        def response_handler(resp: Response) -> Cursor:
-            if not resp.is_success:
-                raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request, partial(self._cursor_response_handler, request)
+        )
 
     async def find_in_box(
             self,
@@ -938,26 +1510,23 @@ class Collection(ApiGroup):
         :rtype: aioarango.cursor.Cursor
         :raises aioarango.exceptions.DocumentGetError: If retrieval fails.
         """
-        assert isinstance(latitude1, Number), "latitude1 must be a number"
-        assert isinstance(longitude1, Number), "longitude1 must be a number"
-        assert isinstance(latitude2, Number), "latitude2 must be a number"
-        assert isinstance(longitude2, Number), "longitude2 must be a number"
+        assert is_number(latitude1), "latitude1 must be a number"
+        assert is_number(longitude1), "longitude1 must be a number"
+        assert is_number(latitude2), "latitude2 must be a number"
+        assert is_number(longitude2), "longitude2 must be a number"
         assert is_none_or_int(skip), "skip must be a non-negative int"
         assert is_none_or_int(limit), "limit must be a non-negative int"
 
-        data: Json = {
+        data: Json = _compact({
             "collection": self._name,
             "latitude1": latitude1,
             "longitude1": longitude1,
             "latitude2": latitude2,
             "longitude2": longitude2,
-        }
-        if skip is not None:
-            data["skip"] = skip
-        if limit is not None:
-            data["limit"] = limit
-        if index is not None:
-            data["geo"] = self._name + "/" + index
+            "skip": skip,
+            "limit": limit,
+            "geo": None if index is None else self._id_prefix + index,
+        })
 
         request = Request(
             method="put",
@@ -966,18 +1535,31 @@ class Collection(ApiGroup):
             read=self.name,
         )
 
-        def response_handler(resp: Response) -> Cursor:
-            if not resp.is_success:
-                raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request, partial(self._cursor_response_handler, request)
+        )
 
     async def find_by_text(
-            self, field: str, query: str, limit: Optional[int] = None, allow_dirty_read: bool = False,
+            self,
+            field: str,
+            query: str,
+            limit: Optional[int] = None,
+            allow_dirty_read: bool = False,
+            view: Optional[str] = None,
+            analyzer: str = "text_en",
+            batch_size: Optional[int] = None,
+            ttl: Optional[Number] = None,
+            memory_limit: Optional[int] = None,
+            cache: Optional[bool] = None,
+            count: bool = True,
     ) -> Result[Cursor]:
         """Return documents that match the given fulltext query.
 
+        If **view** is given, the query is answered by that ArangoSearch view
+        instead of the legacy fulltext index. The view must link this
+        collection and index **field** with **analyzer**, and **query** is
+        then tokenized by the analyzer rather than parsed as fulltext syntax.
+
         :param field: Document field with fulltext index.
         :type field: str
         :param query: Fulltext query.
@@ -986,11 +1568,32 @@ class Collection(ApiGroup):
         :type limit: int | None
         :param allow_dirty_read: Allow reads from followers in a cluster.
         :type allow_dirty_read: bool | None
+        :param view: Name of an ArangoSearch view linking this collection.
+        :type view: str | None
+        :param analyzer: Analyzer used to tokenize **query** when searching
+            **view**.
+        :type analyzer: str
+        :param batch_size: Number of documents fetched by the cursor in one
+            round trip.
+        :type batch_size: int | None
+        :param ttl: Server side time-to-live for the cursor in seconds.
+        :type ttl: int | None
+        :param memory_limit: Max amount of memory the query is allowed to use
+            in bytes. Value 0 indicates no limit.
+        :type memory_limit: int | None
+        :param cache: If set to True, the query cache is used. The operation
+            mode of the query cache must be set to "on" or "demand".
+        :type cache: bool | None
+        :param count: If set to True, the total document count is included in
+            the result cursor. Set to False to spare the server from counting
+            the full result set before returning the first batch.
+        :type count: bool
         :returns: Document cursor.
         :rtype: aioarango.cursor.Cursor
         :raises aioarango.exceptions.DocumentGetError: If retrieval fails.
         """
         assert is_none_or_int(limit), "limit must be a non-negative int"
+        assert is_none_or_str(view), "view must be a str"
 
         bind_vars: Json = {
             "collection": self._name,
@@ -1000,27 +1603,32 @@ class Collection(ApiGroup):
         if limit is not None:
             bind_vars["limit"] = limit
 
-        aql = """
-        FOR doc IN FULLTEXT(@collection, @field, @query{})
-            RETURN doc
-        """.format(
-            "" if limit is None else ", @limit"
-        )
+        if view is None:
+            aql = _FULLTEXT_QUERY if limit is None else _FULLTEXT_LIMIT_QUERY
+        else:
+            aql = _SEARCH_QUERY if limit is None else _SEARCH_LIMIT_QUERY
+            bind_vars["@view"] = view
+            bind_vars["analyzer"] = analyzer
 
         request = Request(
             method="post",
             endpoint="/_api/cursor",
-            data={"query": aql, "bindVars": bind_vars, "count": True},
+            data=_compact({
+                "query": aql,
+                "bindVars": bind_vars,
+                "count": count,
+                "batchSize": batch_size,
+                "ttl": ttl,
+                "memoryLimit": memory_limit,
+                "cache": cache,
+            }),
             read=self.name,
-            headers={"x-arango-allow-dirty-read": "true"} if allow_dirty_read else None,
+            headers=_DIRTY_READ_HEADERS if allow_dirty_read else None,
         )
 
-        def response_handler(resp: Response) -> Cursor:
-            if not resp.is_success:
-                raise DocumentGetError(resp, request)
-            return Cursor(self._conn, resp.body)
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request, partial(self._cursor_response_handler, request)
+        )
 
     async def get_many(self, documents: Sequence[Union[str, Json]], allow_dirty_read: bool = False, ) -> Result[
         List[Json]]:
@@ -1035,17 +1643,22 @@ class Collection(ApiGroup):
         :rtype: [dict]
         :raise aioarango.exceptions.DocumentGetError: If retrieval fails.
         """
-        handles = [self._extract_id(d) if isinstance(d, dict) else d for d in documents]
+        # Plain lists of keys or IDs (the common case) are sent as they are.
+        if all(type(d) is str for d in documents):
+            handles = list(documents)
+        else:
+            extract_id = self._extract_id
+            handles = [extract_id(d) if isinstance(d, dict) else d for d in documents]
 
-        params: Params = {"onlyget": True}
+        params: Params = {"onlyget": "1"}
 
         request = Request(
             method="put",
-            endpoint=f"/_api/document/{self.name}",
+            endpoint=self._doc_endpoint,
             params=params,
             data=handles,
             read=self.name,
-            headers={"x-arango-allow-dirty-read": "true"} if allow_dirty_read else None,
+            headers=_DIRTY_READ_HEADERS if allow_dirty_read else None,
         )
 
         def response_handler(resp: Response) -> List[Json]:
@@ -1125,6 +1738,36 @@ class Collection(ApiGroup):
 
         return await self._execute(request, response_handler)
 
+    async def add_indexes(self, indexes: Sequence[Json]) -> List[Result[Json]]:
+        """Create multiple indexes concurrently.
+
+        Instead of creating the indexes one round trip after another, the
+        requests are sent concurrently (up to the connection pool size).
+
+        :param indexes: Index definitions as accepted by the server, e.g.
+            ``{"type": "persistent", "fields": ["foo"], "unique": True}``.
+        :type indexes: [dict]
+        :return: New index details, in the order of **indexes**.
+        :rtype: [dict]
+        :raise aioarango.exceptions.IndexCreateError: If create fails.
+        """
+        requests = [
+            Request(
+                method="post",
+                endpoint="/_api/index",
+                data=data,
+                params={"collection": self.name},
+            )
+            for data in indexes
+        ]
+
+        def response_handler(request: Request, resp: Response) -> Json:
+            if not resp.is_success:
+                raise IndexCreateError(resp, request)
+            return format_index(resp.body)
+
+        return await self._execute_many(requests, response_handler)
+
     async def add_hash_index(
             self,
             fields: Sequence[str],
@@ -1154,20 +1797,16 @@ class Collection(ApiGroup):
         :rtype: dict
         :raise aioarango.exceptions.IndexCreateError: If create fails.
         """
-        data: Json = {"type": "hash", "fields": fields}
-
-        if unique is not None:
-            data["unique"] = unique
-        if sparse is not None:
-            data["sparse"] = sparse
-        if deduplicate is not None:
-            data["deduplicate"] = deduplicate
-        if name is not None:
-            data["name"] = name
-        if in_background is not None:
-            data["inBackground"] = in_background
-
-        return await self._add_index(data)
+        data: Json = {
+            "type": "hash",
+            "fields": fields,
+            "unique": unique,
+            "sparse": sparse,
+            "deduplicate": deduplicate,
+            "name": name,
+            "inBackground": in_background,
+        }
+        return await self._add_index(_compact(data))
 
     async def add_skiplist_index(
             self,
@@ -1198,20 +1837,16 @@ class Collection(ApiGroup):
         :rtype: dict
         :raise aioarango.exceptions.IndexCreateError: If create fails.
         """
-        data: Json = {"type": "skiplist", "fields": fields}
-
-        if unique is not None:
-            data["unique"] = unique
-        if sparse is not None:
-            data["sparse"] = sparse
-        if deduplicate is not None:
-            data["deduplicate"] = deduplicate
-        if name is not None:
-            data["name"] = name
-        if in_background is not None:
-            data["inBackground"] = in_background
-
-        return await self._add_index(data)
+        data: Json = {
+            "type": "skiplist",
+            "fields": fields,
+            "unique": unique,
+            "sparse": sparse,
+            "deduplicate": deduplicate,
+            "name": name,
+            "inBackground": in_background,
+        }
+        return await self._add_index(_compact(data))
 
     async def add_geo_index(
             self,
@@ -1241,18 +1876,15 @@ class Collection(ApiGroup):
         :rtype: dict
         :raise aioarango.exceptions.IndexCreateError: If create fails.
         """
-        data: Json = {"type": "geo", "fields": fields}
-
-        if ordered is not None:
-            data["geoJson"] = ordered
-        if name is not None:
-            data["name"] = name
-        if in_background is not None:
-            data["inBackground"] = in_background
-        if legacyPolygons is not None:
-            data["legacyPolygons"] = legacyPolygons
-
-        return await self._add_index(data)
+        data: Json = {
+            "type": "geo",
+            "fields": fields,
+            "geoJson": ordered,
+            "name": name,
+            "inBackground": in_background,
+            "legacyPolygons": legacyPolygons,
+        }
+        return await self._add_index(_compact(data))
 
     async def add_fulltext_index(
             self,
@@ -1277,16 +1909,14 @@ class Collection(ApiGroup):
         :rtype: dict
         :raise aioarango.exceptions.IndexCreateError: If create fails.
         """
-        data: Json = {"type": "fulltext", "fields": fields}
-
-        if min_length is not None:
-            data["minLength"] = min_length
-        if name is not None:
-            data["name"] = name
-        if in_background is not None:
-            data["inBackground"] = in_background
-
-        return await self._add_index(data)
+        data: Json = {
+            "type": "fulltext",
+            "fields": fields,
+            "minLength": min_length,
+            "name": name,
+            "inBackground": in_background,
+        }
+        return await self._add_index(_compact(data))
 
     async def add_persistent_index(
             self,
@@ -1329,22 +1959,17 @@ class Collection(ApiGroup):
         :rtype: dict
         :raise aioarango.exceptions.IndexCreateError: If create fails.
         """
-        data: Json = {"type": "persistent", "fields": fields}
-
-        if unique is not None:
-            data["unique"] = unique
-        if sparse is not None:
-            data["sparse"] = sparse
-        if name is not None:
-            data["name"] = name
-        if in_background is not None:
-            data["inBackground"] = in_background
-        if storedValues is not None:
-            data["storedValues"] = storedValues
-        if cacheEnabled is not None:
-            data["cacheEnabled"] = cacheEnabled
-
-        return await self._add_index(data)
+        data: Json = {
+            "type": "persistent",
+            "fields": fields,
+            "unique": unique,
+            "sparse": sparse,
+            "name": name,
+            "inBackground": in_background,
+            "storedValues": storedValues,
+            "cacheEnabled": cacheEnabled,
+        }
+        return await self._add_index(_compact(data))
 
     async def add_ttl_index(
             self,
@@ -1367,14 +1992,14 @@ class Collection(ApiGroup):
         :rtype: dict
         :raise aioarango.exceptions.IndexCreateError: If create fails.
         """
-        data: Json = {"type": "ttl", "fields": fields, "expireAfter": expiry_time}
-
-        if name is not None:
-            data["name"] = name
-        if in_background is not None:
-            data["inBackground"] = in_background
-
-        return await self._add_index(data)
+        data: Json = {
+            "type": "ttl",
+            "fields": fields,
+            "expireAfter": expiry_time,
+            "name": name,
+            "inBackground": in_background,
+        }
+        return await self._add_index(_compact(data))
 
     async def add_inverted_index(
             self,
@@ -1398,7 +2023,9 @@ class Collection(ApiGroup):
         :type name: str | None
         :param inBackground: Do not hold the collection lock.
         :type inBackground: bool | None
-        :param parallelism:
+        :param parallelism: Number of threads the server uses to build the
+            index (server default is 2). Raising it speeds up the initial
+            build of large collections on servers with spare cores.
         :type parallelism: int | None
         :param primarySort:
         :type primarySort: Json | None
@@ -1418,32 +2045,21 @@ class Collection(ApiGroup):
         :rtype: dict
         :raise arango.exceptions.IndexCreateError: If create fails.
         """
-        data: Json = {"type": "inverted", "fields": fields}
-
-        if name is not None:
-            data["name"] = name
-        if inBackground is not None:
-            data["inBackground"] = inBackground
-        if parallelism is not None:
-            data["parallelism"] = parallelism
-        if primarySort is not None:
-            data["primarySort"] = primarySort
-        if storedValues is not None:
-            data["storedValues"] = storedValues
-        if analyzer is not None:
-            data["analyzer"] = analyzer
-        if features is not None:
-            data["features"] = features
-        if includeAllFields is not None:
-            data["includeAllFields"] = includeAllFields
-        if trackListPositions is not None:
-            data["trackListPositions"] = trackListPositions
-        if searchField is not None:
-            data["searchField"] = searchField
-        if fields is not None:
-            data["fields"] = fields
-
-        return await self._add_index(data)
+        data: Json = {
+            "type": "inverted",
+            "fields": fields,
+            "name": name,
+            "inBackground": inBackground,
+            "parallelism": parallelism,
+            "primarySort": primarySort,
+            "storedValues": storedValues,
+            "analyzer": analyzer,
+            "features": features,
+            "includeAllFields": includeAllFields,
+            "trackListPositions": trackListPositions,
+            "searchField": searchField,
+        }
+        return await self._add_index(_compact(data))
 
     async def delete_index(self, index_id: str, ignore_missing: bool = False) -> Result[bool]:
         """Delete an index.
@@ -1458,7 +2074,7 @@ class Collection(ApiGroup):
         :raise aioarango.exceptions.IndexDeleteError: If delete fails.
         """
         request = Request(
-            method="delete", endpoint=f"/_api/index/{self.name}/{index_id}"
+            method="delete", endpoint=self._index_prefix + index_id
         )
 
         def response_handler(resp: Response) -> bool:
@@ -1479,7 +2095,7 @@ class Collection(ApiGroup):
         """
         request = Request(
             method="put",
-            endpoint=f"/_api/collection/{self.name}/loadIndexesIntoMemory",
+            endpoint=self._coll_endpoint + "/loadIndexesIntoMemory",
         )
 
         def response_handler(resp: Response) -> bool:
@@ -1491,7 +2107,7 @@ class Collection(ApiGroup):
 
     async def insert_many(
             self,
-            documents: Sequence[Json],
+            documents: Union[Sequence[Json], bytes],
             return_new: bool = False,
             sync: Optional[bool] = None,
             silent: bool = False,
@@ -1500,6 +2116,7 @@ class Collection(ApiGroup):
             overwrite_mode: Optional[str] = None,
             keep_none: Optional[bool] = None,
             merge: Optional[bool] = None,
+            chunk_size: Optional[int] = None,
     ) -> Result[Union[bool, List[Union[Json, ArangoServerError]]]]:
         """Insert multiple documents.
 
@@ -1522,7 +2139,9 @@ class Collection(ApiGroup):
         :param documents: List of new documents to insert. If they contain the
             "_key" or "_id" fields, the values are used as the keys of the new
             documents (auto-generated otherwise). Any "_rev" field is ignored.
-        :type documents: [dict]
+            A JSON array already serialized to bytes is sent as is, in which
+            case "_id" fields are not turned into "_key" fields.
+        :type documents: [dict] | bytes
         :param return_new: Include bodies of the new documents in the returned
             metadata. Ignored if parameter **silent** is set to True
         :type return_new: bool
@@ -1550,6 +2169,11 @@ class Collection(ApiGroup):
             instead of the new one overwriting the old one. Applies only when
             **overwrite_mode** is set to "update" (update-insert).
         :type merge: bool | None
+        :param chunk_size: If set, documents are sent in chunks of this size
+            as separate concurrent requests, and the results are merged in
+            order. Ignored in async and batch execution contexts, and for
+            pre-serialized **documents**.
+        :type chunk_size: int | None
         :return: Document metadata (e.g. document key, revision) or True if
             parameter **silent** was set to True.
         :return: List of document metadata (e.g. document keys, revisions) and
@@ -1557,52 +2181,62 @@ class Collection(ApiGroup):
         :rtype: [dict | ArangoServerError] | bool
         :raise aioarango.exceptions.DocumentInsertError: If insert fails.
         """
-        documents = [self._ensure_key_from_id(doc) for doc in documents]
+        assert is_none_or_int(chunk_size), "chunk_size must be a non-negative int"
 
-        params: Params = {
+        if isinstance(documents, _BYTES_TYPES):
+            documents = bytes(documents)
+        else:
+            # Only documents with "_id" but no "_key" need a (copied) new body.
+            ensure_key = self._ensure_key_from_id
+            documents = [
+                doc if "_key" in doc or "_id" not in doc else ensure_key(doc)
+                for doc in documents
+            ]
+
+        params: Params = _compact({
             "returnNew": return_new,
             "silent": silent,
             "overwrite": overwrite,
             "returnOld": return_old,
-        }
-        if sync is not None:
-            params["waitForSync"] = sync
+            "waitForSync": sync,
+            "overwriteMode": overwrite_mode,
+            "keepNull": keep_none,
+            "mergeObjects": merge,
+        })
 
-        if overwrite_mode is not None:
-            params["overwriteMode"] = overwrite_mode
-        if keep_none is not None:
-            params["keepNull"] = keep_none
-        if merge is not None:
-            params["mergeObjects"] = merge
+        response_handler = partial(
+            self._bulk_response_handler, DocumentInsertError, {}, silent
+        )
+
+        if (
+                chunk_size
+                and not isinstance(documents, bytes)
+                and len(documents) > chunk_size
+                and self.context in ("default", "transaction")
+        ):
+            requests = [
+                Request(
+                    method="post",
+                    endpoint=self._doc_endpoint,
+                    data=chunk,
+                    params=params,
+                    parse_body=not silent,
+                )
+                for chunk in get_batches(documents, chunk_size)
+            ]
+            chunk_results = await self._execute_many(requests, response_handler)
+            if silent is True:
+                return True
+            return [result for chunk in chunk_results for result in chunk]
 
         request = Request(
             method="post",
-            endpoint=f"/_api/document/{self.name}",
+            endpoint=self._doc_endpoint,
             data=documents,
             params=params,
+            parse_body=not silent,
         )
-
-        def response_handler(
-                resp: Response,
-        ) -> Union[bool, List[Union[Json, ArangoServerError]]]:
-            if not resp.is_success:
-                raise DocumentInsertError(resp, request)
-            if silent is True:
-                return True
-
-            results: List[Union[Json, ArangoServerError]] = []
-            for body in resp.body:
-                if "_id" in body:
-                    if "_oldRev" in body:
-                        body["_old_rev"] = body.pop("_oldRev")
-                    results.append(body)
-                else:
-                    sub_resp = self._conn.prep_bulk_err_response(resp, body)
-                    results.append(DocumentInsertError(sub_resp, request))
-
-            return results
-
-        return await self._execute(request, response_handler)
+        return await self._execute(request, partial(response_handler, request))
 
     async def update_many(
             self,
@@ -1673,43 +2307,29 @@ class Collection(ApiGroup):
         if sync is not None:
             params["waitForSync"] = sync
 
-        documents = [self._ensure_key_in_body(doc) for doc in documents]
+        # Only documents without "_key" need a (copied) new body.
+        ensure_key = self._ensure_key_in_body
+        documents = [doc if "_key" in doc else ensure_key(doc) for doc in documents]
 
         request = Request(
             method="patch",
-            endpoint=f"/_api/document/{self.name}",
+            endpoint=self._doc_endpoint,
             data=documents,
             params=params,
             write=self.name,
+            parse_body=not silent,
         )
 
-        def response_handler(
-                resp: Response,
-        ) -> Union[bool, List[Union[Json, ArangoServerError]]]:
-            if not resp.is_success:
-                raise DocumentUpdateError(resp, request)
-            if silent is True:
-                return True
-
-            results = []
-            for body in resp.body:
-                if "_id" in body:
-                    body["_old_rev"] = body.pop("_oldRev")
-                    results.append(body)
-                else:
-                    sub_resp = self._conn.prep_bulk_err_response(resp, body)
-
-                    error: ArangoServerError
-                    if sub_resp.error_code == 1200:
-                        error = DocumentRevisionError(sub_resp, request)
-                    else:  # pragma: no cover
-                        error = DocumentUpdateError(sub_resp, request)
-
-                    results.append(error)
-
-            return results
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request,
+            partial(
+                self._bulk_response_handler,
+                DocumentUpdateError,
+                _REVISION_ERRORS,
+                silent,
+                request,
+            ),
+        )
 
     async def update_match(
             self,
@@ -1837,43 +2457,29 @@ class Collection(ApiGroup):
         if sync is not None:
             params["waitForSync"] = sync
 
-        documents = [self._ensure_key_in_body(doc) for doc in documents]
+        # Only documents without "_key" need a (copied) new body.
+        ensure_key = self._ensure_key_in_body
+        documents = [doc if "_key" in doc else ensure_key(doc) for doc in documents]
 
         request = Request(
             method="put",
-            endpoint=f"/_api/document/{self.name}",
+            endpoint=self._doc_endpoint,
             params=params,
             data=documents,
             write=self.name,
+            parse_body=not silent,
         )
 
-        def response_handler(
-                resp: Response,
-        ) -> Union[bool, List[Union[Json, ArangoServerError]]]:
-            if not resp.is_success:
-                raise DocumentReplaceError(resp, request)
-            if silent is True:
-                return True
-
-            results: List[Union[Json, ArangoServerError]] = []
-            for body in resp.body:
-                if "_id" in body:
-                    body["_old_rev"] = body.pop("_oldRev")
-                    results.append(body)
-                else:
-                    sub_resp = self._conn.prep_bulk_err_response(resp, body)
-
-                    error: ArangoServerError
-                    if sub_resp.error_code == 1200:
-                        error = DocumentRevisionError(sub_resp, request)
-                    else:  # pragma: no cover
-                        error = DocumentReplaceError(sub_resp, request)
-
-                    results.append(error)
-
-            return results
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request,
+            partial(
+                self._bulk_response_handler,
+                DocumentReplaceError,
+                _REVISION_ERRORS,
+                silent,
+                request,
+            ),
+        )
 
     async def replace_match(
             self,
@@ -1979,44 +2585,34 @@ class Collection(ApiGroup):
         if sync is not None:
             params["waitForSync"] = sync
 
-        documents = [
-            self._ensure_key_in_body(doc) if isinstance(doc, dict) else doc
-            for doc in documents
-        ]
+        # Plain lists of keys or IDs are sent as they are. Otherwise, only
+        # document bodies without "_key" need a (copied) new body.
+        if not all(type(doc) is str for doc in documents):
+            ensure_key = self._ensure_key_in_body
+            documents = [
+                ensure_key(doc) if isinstance(doc, dict) and "_key" not in doc else doc
+                for doc in documents
+            ]
 
         request = Request(
             method="delete",
-            endpoint=f"/_api/document/{self.name}",
+            endpoint=self._doc_endpoint,
             params=params,
             data=documents,
             write=self.name,
+            parse_body=not silent,
         )
 
-        def response_handler(
-                resp: Response,
-        ) -> Union[bool, List[Union[Json, ArangoServerError]]]:
-            if not resp.is_success:
-                raise DocumentDeleteError(resp, request)
-            if silent is True:
-                return True
-
-            results: List[Union[Json, ArangoServerError]] = []
-            for body in resp.body:
-                if "_id" in body:
-                    results.append(body)
-                else:
-                    sub_resp = self._conn.prep_bulk_err_response(resp, body)
-
-                    error: ArangoServerError
-                    if sub_resp.error_code == 1200:
-                        error = DocumentRevisionError(sub_resp, request)
-                    else:
-                        error = DocumentDeleteError(sub_resp, request)
-                    results.append(error)
-
-            return results
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request,
+            partial(
+                self._bulk_response_handler,
+                DocumentDeleteError,
+                _REVISION_ERRORS,
+                silent,
+                request,
+            ),
+        )
 
     async def delete_match(
             self, filters: Json, limit: Optional[int] = None, sync: Optional[bool] = None
@@ -2065,7 +2661,7 @@ class Collection(ApiGroup):
 
     async def import_bulk(
             self,
-            documents: Sequence[Json],
+            documents: Union[Sequence[Json], bytes],
             halt_on_error: bool = True,
             details: bool = True,
             from_prefix: Optional[str] = None,
@@ -2074,6 +2670,7 @@ class Collection(ApiGroup):
             on_duplicate: Optional[str] = None,
             sync: Optional[bool] = None,
             batch_size: Optional[int] = None,
+            max_in_flight: Optional[int] = None,
     ) -> Union[Result[Json], List[Result[Json]]]:
         """Insert multiple documents into the collection.
 
@@ -2093,7 +2690,10 @@ class Collection(ApiGroup):
         :param documents: List of new documents to insert. If they contain the
             "_key" or "_id" fields, the values are used as the keys of the new
             documents (auto-generated otherwise). Any "_rev" field is ignored.
-        :type documents: [dict]
+            Documents already serialized to bytes, either as a JSON array or
+            as line-delimited JSON (one document per line), are sent as is, in
+            which case "_id" fields are not turned into "_key" fields.
+        :type documents: [dict] | bytes
         :param halt_on_error: Halt the entire import on an error.
         :type halt_on_error: bool
         :param details: If set to True, the returned result will include an
@@ -2125,7 +2725,10 @@ class Collection(ApiGroup):
         :param sync: Block until operation is synchronized to disk.
         :type sync: bool | None
         :param batch_size: Split up **documents** into batches of max length
-            **batch_size** and import them in a loop on the client side. If
+            **batch_size** and import them concurrently on the client side
+            (up to the connection pool size at once, one at a time in
+            transactions). If a batch fails, batches already sent may still
+            be imported. If
             **batch_size** is specified, the return type of this method
             changes from a result object to a list of result objects.
             IMPORTANT NOTE: this parameter may go through breaking changes
@@ -2134,6 +2737,9 @@ class Collection(ApiGroup):
             depending on the return value if possible. Cannot be used with
             parameter **overwrite**.
         :type batch_size: int
+        :param max_in_flight: Max number of batches imported at once. Defaults
+            to the connection pool size. Ignored if **batch_size** is not set.
+        :type max_in_flight: int | None
         :return: Result of the bulk import.
         :rtype: dict | list[dict]
         :raise aioarango.exceptions.DocumentInsertError: If import fails.
@@ -2141,26 +2747,34 @@ class Collection(ApiGroup):
         if overwrite and batch_size is not None:
             msg = "Cannot use parameter 'batch_size' if 'overwrite' is set to True"
             raise ValueError(msg)
+        if batch_size is not None and isinstance(documents, _BYTES_TYPES):
+            msg = "Cannot use parameter 'batch_size' with pre-serialized documents"
+            raise ValueError(msg)
 
-        documents = [self._ensure_key_from_id(doc) for doc in documents]
-
-        params: Params = {"type": "array", "collection": self.name}
-        if halt_on_error is not None:
-            params["complete"] = halt_on_error
-        if details is not None:
-            params["details"] = details
-        if from_prefix is not None:  # pragma: no cover
-            params["fromPrefix"] = from_prefix
-        if to_prefix is not None:  # pragma: no cover
-            params["toPrefix"] = to_prefix
-        if overwrite is not None:
-            params["overwrite"] = overwrite
-        if on_duplicate is not None:
-            params["onDuplicate"] = on_duplicate
-        if sync is not None:
-            params["waitForSync"] = sync
+        if isinstance(documents, _BYTES_TYPES):
+            documents = bytes(documents)
+        else:
+            # Only documents with "_id" but no "_key" need a (copied) new body.
+            ensure_key = self._ensure_key_from_id
+            documents = [
+                doc if "_key" in doc or "_id" not in doc else ensure_key(doc)
+                for doc in documents
+            ]
+
+        params: Params = _compact({
+            # Let the server tell JSON arrays from line-delimited JSON in bytes.
+            "type": "auto" if isinstance(documents, bytes) else "array",
+            "collection": self.name,
+            "complete": halt_on_error,
+            "details": details,
+            "fromPrefix": from_prefix,
+            "toPrefix": to_prefix,
+            "overwrite": overwrite,
+            "onDuplicate": on_duplicate,
+            "waitForSync": sync,
+        })
 
-        def response_handler(resp: Response) -> Json:
+        def response_handler(request: Request, resp: Response) -> Json:
             if resp.is_success:
                 result: Json = resp.body
                 return result
@@ -2175,25 +2789,26 @@ class Collection(ApiGroup):
                 write=self.name,
             )
 
-            return await self._execute(request, response_handler)
+            return await self._execute(request, partial(response_handler, request))
         else:
-            results = []
-            for batch in get_batches(documents, batch_size):
-                request = Request(
+            requests = [
+                Request(
                     method="post",
                     endpoint="/_api/import",
                     data=batch,
                     params=params,
                     write=self.name,
                 )
-                results.append(await self._execute(request, response_handler))
-
-            return results
+                for batch in get_batches(documents, batch_size)
+            ]
+            return await self._execute_many(requests, response_handler, max_in_flight)
 
 
 class StandardCollection(Collection):
     """Standard ArangoDB collection API wrapper."""
 
+    __slots__: List[str] = []
+
     def __repr__(self) -> str:
         return f"<StandardCollection {self.name}>"
 
@@ -2228,11 +2843,11 @@ class StandardCollection(Collection):
         handle, body, headers = self._prep_from_doc(document, rev, check_rev)
 
         if allow_dirty_read:
-            headers["x-arango-allow-dirty-read"] = "true"
+            headers = {**headers, **_DIRTY_READ_HEADERS}
 
         request = Request(
             method="get",
-            endpoint=f"/_api/document/{handle}",
+            endpoint=_DOC_PREFIX + handle,
             headers=headers,
             read=self.name,
         )
@@ -2252,7 +2867,7 @@ class StandardCollection(Collection):
 
     async def insert(
             self,
-            document: Json,
+            document: Union[Json, bytes],
             return_new: bool = False,
             sync: Optional[bool] = None,
             silent: bool = False,
@@ -2266,8 +2881,10 @@ class StandardCollection(Collection):
 
         :param document: Document to insert. If it contains the "_key" or "_id"
             field, the value is used as the key of the new document (otherwise
-            it is auto-generated). Any "_rev" field is ignored.
-        :type document: dict
+            it is auto-generated). Any "_rev" field is ignored. A JSON object
+            already serialized to bytes is sent as is, in which case an "_id"
+            field is not turned into a "_key" field.
+        :type document: dict | bytes
         :param return_new: Include body of the new document in the returned
             metadata. Ignored if parameter **silent** is set to True.
         :type return_new: bool
@@ -2300,29 +2917,29 @@ class StandardCollection(Collection):
         :rtype: bool | dict
         :raise aioarango.exceptions.DocumentInsertError: If insert fails.
         """
-        document = self._ensure_key_from_id(document)
+        if isinstance(document, _BYTES_TYPES):
+            document = bytes(document)
+        else:
+            document = self._ensure_key_from_id(document)
 
-        params: Params = {
+        params: Params = _compact({
             "returnNew": return_new,
             "silent": silent,
             "overwrite": overwrite,
             "returnOld": return_old,
-        }
-        if sync is not None:
-            params["waitForSync"] = sync
-        if overwrite_mode is not None:
-            params["overwriteMode"] = overwrite_mode
-        if keep_none is not None:
-            params["keepNull"] = keep_none
-        if merge is not None:
-            params["mergeObjects"] = merge
+            "waitForSync": sync,
+            "overwriteMode": overwrite_mode,
+            "keepNull": keep_none,
+            "mergeObjects": merge,
+        })
 
         request = Request(
             method="post",
-            endpoint=f"/_api/document/{self.name}",
+            endpoint=self._doc_endpoint,
             data=document,
             params=params,
             write=self.name,
+            parse_body=not silent,
         )
 
         def response_handler(resp: Response) -> Union[bool, Json]:
@@ -2395,10 +3012,11 @@ class StandardCollection(Collection):
 
         request = Request(
             method="patch",
-            endpoint=f"/_api/document/{self._extract_id(document)}",
+            endpoint=_DOC_PREFIX + self._extract_id(document),
             data=document,
             params=params,
             write=self.name,
+            parse_body=not silent,
         )
 
         def response_handler(resp: Response) -> Union[bool, Json]:
@@ -2462,10 +3080,11 @@ class StandardCollection(Collection):
 
         request = Request(
             method="put",
-            endpoint=f"/_api/document/{self._extract_id(document)}",
+            endpoint=_DOC_PREFIX + self._extract_id(document),
             params=params,
             data=document,
             write=self.name,
+            parse_body=not silent,
         )
 
         def response_handler(resp: Response) -> Union[bool, Json]:
@@ -2538,10 +3157,11 @@ class StandardCollection(Collection):
 
         request = Request(
             method="delete",
-            endpoint=f"/_api/document/{handle}",
+            endpoint=_DOC_PREFIX + handle,
             params=params,
             headers=headers,
             write=self.name,
+            parse_body=not silent,
         )
 
         def response_handler(resp):
@@ -2565,11 +3185,18 @@ class VertexCollection(Collection):
     :param name: Vertex collection name.
     """
 
+    __slots__ = ["_graph", "_vertex_prefix", "_vertex_endpoint"]
+
     def __init__(
             self, connection: Connection, executor: ApiExecutor, graph: str, name: str
     ) -> None:
-        super().__init__(connection, executor, name)
         self._graph = graph
+        self._vertex_prefix = "/_api/gharial/" + graph + "/vertex/"
+        super().__init__(connection, executor, name)
+
+    def _set_name(self, name: str) -> None:
+        super()._set_name(name)
+        self._vertex_endpoint = self._vertex_prefix + name
 
     def __repr__(self) -> str:
         return f"<VertexCollection {self.name}>"
@@ -2609,22 +3236,14 @@ class VertexCollection(Collection):
 
         request = Request(
             method="get",
-            endpoint=f"/_api/gharial/{self._graph}/vertex/{handle}",
+            endpoint=self._vertex_prefix + handle,
             headers=headers,
             read=self.name,
         )
 
-        def response_handler(resp: Response) -> Optional[Json]:
-            if resp.error_code == 1202:
-                return None
-            if resp.status_code == 412:
-                raise DocumentRevisionError(resp, request)
-            if not resp.is_success:
-                raise DocumentGetError(resp, request)
-            result: Json = resp.body["vertex"]
-            return result
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request, partial(_graph_get_response_handler, "vertex", request)
+        )
 
     async def insert(
             self,
@@ -2660,20 +3279,23 @@ class VertexCollection(Collection):
 
         request = Request(
             method="post",
-            endpoint=f"/_api/gharial/{self._graph}/vertex/{self.name}",
+            endpoint=self._vertex_endpoint,
             data=vertex,
             params=params,
             write=self.name,
+            parse_body=not silent,
         )
 
-        def response_handler(resp: Response) -> Union[bool, Json]:
-            if not resp.is_success:
-                raise DocumentInsertError(resp, request)
-            if silent:
-                return True
-            return format_vertex(resp.body)
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request,
+            partial(
+                _graph_write_response_handler,
+                DocumentInsertError,
+                format_vertex,
+                silent,
+                request,
+            ),
+        )
 
     async def update(
             self,
@@ -2727,23 +3349,24 @@ class VertexCollection(Collection):
 
         request = Request(
             method="patch",
-            endpoint=f"/_api/gharial/{self._graph}/vertex/{vertex_id}",
+            endpoint=self._vertex_prefix + vertex_id,
             headers=headers,
             params=params,
             data=vertex,
             write=self.name,
+            parse_body=not silent,
         )
 
-        def response_handler(resp: Response) -> Union[bool, Json]:
-            if resp.status_code == 412:  # pragma: no cover
-                raise DocumentRevisionError(resp, request)
-            elif not resp.is_success:
-                raise DocumentUpdateError(resp, request)
-            if silent is True:
-                return True
-            return format_vertex(resp.body)
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request,
+            partial(
+                _graph_write_response_handler,
+                DocumentUpdateError,
+                format_vertex,
+                silent,
+                request,
+            ),
+        )
 
     async def replace(
             self,
@@ -2791,23 +3414,24 @@ class VertexCollection(Collection):
 
         request = Request(
             method="put",
-            endpoint=f"/_api/gharial/{self._graph}/vertex/{vertex_id}",
+            endpoint=self._vertex_prefix + vertex_id,
             headers=headers,
             params=params,
             data=vertex,
             write=self.name,
+            parse_body=not silent,
         )
 
-        def response_handler(resp: Response) -> Union[bool, Json]:
-            if resp.status_code == 412:  # pragma: no cover
-                raise DocumentRevisionError(resp, request)
-            elif not resp.is_success:
-                raise DocumentReplaceError(resp, request)
-            if silent is True:
-                return True
-            return format_vertex(resp.body)
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request,
+            partial(
+                _graph_write_response_handler,
+                DocumentReplaceError,
+                format_vertex,
+                silent,
+                request,
+            ),
+        )
 
     async def delete(
             self,
@@ -2847,30 +3471,29 @@ class VertexCollection(Collection):
         """
         handle, _, headers = self._prep_from_doc(vertex, rev, check_rev)
 
-        params: Params = {"returnOld": return_old}
+        params: Params = {}
+        if return_old:
+            params["returnOld"] = True
         if sync is not None:
             params["waitForSync"] = sync
 
         request = Request(
             method="delete",
-            endpoint=f"/_api/gharial/{self._graph}/vertex/{handle}",
+            endpoint=self._vertex_prefix + handle,
             params=params,
             headers=headers,
             write=self.name,
         )
 
-        def response_handler(resp: Response) -> Union[bool, Json]:
-            if resp.error_code == 1202 and ignore_missing:
-                return False
-            if resp.status_code == 412:  # pragma: no cover
-                raise DocumentRevisionError(resp, request)
-            if not resp.is_success:
-                raise DocumentDeleteError(resp, request)
-
-            result: Json = resp.body
-            return {"old": result["old"]} if return_old else True
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request,
+            partial(
+                _graph_delete_response_handler,
+                ignore_missing,
+                return_old,
+                request,
+            ),
+        )
 
 
 class EdgeCollection(Collection):
@@ -2882,11 +3505,18 @@ class EdgeCollection(Collection):
     :param name: Edge collection name.
     """
 
+    __slots__ = ["_graph", "_edge_prefix", "_edge_endpoint"]
+
     def __init__(
             self, connection: Connection, executor: ApiExecutor, graph: str, name: str
     ) -> None:
-        super().__init__(connection, executor, name)
         self._graph = graph
+        self._edge_prefix = "/_api/gharial/" + graph + "/edge/"
+        super().__init__(connection, executor, name)
+
+    def _set_name(self, name: str) -> None:
+        super()._set_name(name)
+        self._edge_endpoint = self._edge_prefix + name
 
     def __repr__(self) -> str:
         return f"<EdgeCollection {self.name}>"
@@ -2923,23 +3553,14 @@ class EdgeCollection(Collection):
 
         request = Request(
             method="get",
-            endpoint=f"/_api/gharial/{self._graph}/edge/{handle}",
+            endpoint=self._edge_prefix + handle,
             headers=headers,
             read=self.name,
         )
 
-        def response_handler(resp: Response) -> Optional[Json]:
-            if resp.error_code == 1202:
-                return None
-            if resp.status_code == 412:  # pragma: no cover
-                raise DocumentRevisionError(resp, request)
-            if not resp.is_success:
-                raise DocumentGetError(resp, request)
-
-            result: Json = resp.body["edge"]
-            return result
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request, partial(_graph_get_response_handler, "edge", request)
+        )
 
     async def insert(
             self,
@@ -2976,20 +3597,23 @@ class EdgeCollection(Collection):
 
         request = Request(
             method="post",
-            endpoint=f"/_api/gharial/{self._graph}/edge/{self.name}",
+            endpoint=self._edge_endpoint,
             data=edge,
             params=params,
             write=self.name,
+            parse_body=not silent,
         )
 
-        def response_handler(resp: Response) -> Union[bool, Json]:
-            if not resp.is_success:
-                raise DocumentInsertError(resp, request)
-            if silent:
-                return True
-            return format_edge(resp.body)
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request,
+            partial(
+                _graph_write_response_handler,
+                DocumentInsertError,
+                format_edge,
+                silent,
+                request,
+            ),
+        )
 
     async def update(
             self,
@@ -3043,23 +3667,24 @@ class EdgeCollection(Collection):
 
         request = Request(
             method="patch",
-            endpoint=f"/_api/gharial/{self._graph}/edge/{edge_id}",
+            endpoint=self._edge_prefix + edge_id,
             headers=headers,
             params=params,
             data=edge,
             write=self.name,
+            parse_body=not silent,
         )
 
-        def response_handler(resp: Response) -> Union[bool, Json]:
-            if resp.status_code == 412:  # pragma: no cover
-                raise DocumentRevisionError(resp, request)
-            if not resp.is_success:
-                raise DocumentUpdateError(resp, request)
-            if silent is True:
-                return True
-            return format_edge(resp.body)
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request,
+            partial(
+                _graph_write_response_handler,
+                DocumentUpdateError,
+                format_edge,
+                silent,
+                request,
+            ),
+        )
 
     async def replace(
             self,
@@ -3108,23 +3733,24 @@ class EdgeCollection(Collection):
 
         request = Request(
             method="put",
-            endpoint=f"/_api/gharial/{self._graph}/edge/{edge_id}",
+            endpoint=self._edge_prefix + edge_id,
             headers=headers,
             params=params,
             data=edge,
             write=self.name,
+            parse_body=not silent,
         )
 
-        def response_handler(resp: Response) -> Union[bool, Json]:
-            if resp.status_code == 412:  # pragma: no cover
-                raise DocumentRevisionError(resp, request)
-            if not resp.is_success:
-                raise DocumentReplaceError(resp, request)
-            if silent is True:
-                return True
-            return format_edge(resp.body)
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request,
+            partial(
+                _graph_write_response_handler,
+                DocumentReplaceError,
+                format_edge,
+                silent,
+                request,
+            ),
+        )
 
     async def delete(
             self,
@@ -3163,30 +3789,29 @@ class EdgeCollection(Collection):
         """
         handle, _, headers = self._prep_from_doc(edge, rev, check_rev)
 
-        params: Params = {"returnOld": return_old}
+        params: Params = {}
+        if return_old:
+            params["returnOld"] = True
         if sync is not None:
             params["waitForSync"] = sync
 
         request = Request(
             method="delete",
-            endpoint=f"/_api/gharial/{self._graph}/edge/{handle}",
+            endpoint=self._edge_prefix + handle,
             params=params,
             headers=headers,
             write=self.name,
         )
 
-        def response_handler(resp: Response) -> Union[bool, Json]:
-            if resp.error_code == 1202 and ignore_missing:
-                return False
-            if resp.status_code == 412:  # pragma: no cover
-                raise DocumentRevisionError(resp, request)
-            if not resp.is_success:
-                raise DocumentDeleteError(resp, request)
-
-            result: Json = resp.body
-            return {"old": result["old"]} if return_old else True
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request,
+            partial(
+                _graph_delete_response_handler,
+                ignore_missing,
+                return_old,
+                request,
+            ),
+        )
 
     async def link(
             self,
@@ -3222,9 +3847,72 @@ class EdgeCollection(Collection):
         """
         edge = {"_from": get_doc_id(from_vertex), "_to": get_doc_id(to_vertex)}
         if data is not None:
-            edge.update(self._ensure_key_from_id(data))
+            edge.update(data)
+            self._ensure_key_from_id(edge, copy=False)
         return await self.insert(edge, sync=sync, silent=silent, return_new=return_new)
 
+    async def link_many(
+            self,
+            links: Sequence[Tuple[Union[str, Json], Union[str, Json]]],
+            data: Optional[Sequence[Json]] = None,
+            sync: Optional[bool] = None,
+            silent: bool = False,
+            return_new: bool = False,
+    ) -> Result[Union[bool, List[Union[Json, ArangoServerError]]]]:
+        """Insert new edge documents linking the given pairs of vertices.
+
+        Unlike calling :func:`aioarango.collection.EdgeCollection.link`
+        repeatedly, all edges are inserted in a single request.
+
+        .. note::
+
+            If inserting an edge fails, the exception is not raised but
+            returned as an object in the result list. It is up to you to
+            inspect the list to determine which edges were inserted
+            successfully (returns document metadata) and which were not
+            (returns exception object).
+
+        .. note::
+
+            This method does NOT provide the transactional guarantees and
+            validations that single insert operation does for graphs. If these
+            properties are required, see
+            :func:`aioarango.database.StandardDatabase.begin_batch_execution`
+            for an alternative approach.
+
+        :param links: Pairs of "from" and "to" vertex document IDs or bodies
+            with "_id" field.
+        :type links: [(str | dict, str | dict)]
+        :param data: Extra data for each new edge document, in the order of
+            **links**. If one has "_key" or "_id" field, its value is used as
+            key of the new edge document (otherwise it is auto-generated).
+        :type data: [dict] | None
+        :param sync: Block until operation is synchronized to disk.
+        :type sync: bool | None
+        :param silent: If set to True, no document metadata is returned. This
+            can be used to save resources.
+        :type silent: bool
+        :param return_new: Include bodies of the new documents in the returned
+            metadata. Ignored if parameter **silent** is set to True.
+        :type return_new: bool
+        :return: List of document metadata (e.g. document keys, revisions) and
+            any exceptions, or True if parameter **silent** was set to True.
+        :rtype: [dict | ArangoServerError] | bool
+        :raise aioarango.exceptions.DocumentInsertError: If insert fails.
+        """
+        assert data is None or len(data) == len(links), "data must match links"
+
+        edges = [
+            {"_from": get_doc_id(from_vertex), "_to": get_doc_id(to_vertex)}
+            for from_vertex, to_vertex in links
+        ]
+        if data is not None:
+            for edge, extra in zip(edges, data):
+                edge.update(extra)
+        return await self.insert_many(
+            edges, sync=sync, silent=silent, return_new=return_new
+        )
+
     async def edges(
             self, vertex: Union[str, Json], direction: Optional[str] = None, allow_dirty_read: bool = False,
     ) -> Result[Json]:
@@ -3250,19 +3938,9 @@ class EdgeCollection(Collection):
             endpoint=f"/_api/edges/{self.name}",
             params=params,
             read=self.name,
-            headers={"x-arango-allow-dirty-read": "true"} if allow_dirty_read else None,
+            headers=_DIRTY_READ_HEADERS if allow_dirty_read else None,
         )
 
-        def response_handler(resp: Response) -> Json:
-            if not resp.is_success:
-                raise EdgeListError(resp, request)
-            stats = resp.body["stats"]
-            return {
-                "edges": resp.body["edges"],
-                "stats": {
-                    "filtered": stats["filtered"],
-                    "scanned_index": stats["scannedIndex"],
-                },
-            }
-
-        return await self._execute(request, response_handler)
+        return await self._execute(
+            request, partial(_edge_list_response_handler, request)
+        )
@@ -29,7 +29,7 @@ class BaseConnection(object):
         sessions: Sequence[httpx.AsyncClient],
         db_name: str,
         http_client: HTTPClient,
-        serializer: Callable[..., str],
+        serializer: Callable[..., Union[str, bytes]],
         deserializer: Callable[[str], Any],
     ):
         self._url_prefixes = [f"{host}/_db/{db_name}" for host in hosts]
@@ -50,6 +50,16 @@ class BaseConnection(object):
         """
         return self._db_name
 
+    @property
+    def pool_size(self) -> Optional[int]:
+        """Return the connection pool size of the HTTP client.
+
+        :returns: Connection pool size, or None if the HTTP client does not
+            define one.
+        :rtype: int | None
+        """
+        return getattr(self._http, "POOL_SIZE", None)
+
     @property
     def username(self) -> Optional[str]:
         """Return the username.
@@ -59,15 +69,28 @@ class BaseConnection(object):
         """
         return self._username
 
-    def serialize(self, obj: Any) -> str:
+    def serialize(self, obj: Any) -> Union[str, bytes]:
         """Serialize the given object.
 
+        :param obj: JSON object to serialize.
+        :type obj: str | bool | int | float | list | dict | None
+        :return: Serialized string or UTF-8 encoded bytes.
+        :rtype: str | bytes
+        """
+        return self._serializer(obj)
+
+    def serialize_str(self, obj: Any) -> str:
+        """Serialize the given object to a string.
+
         :param obj: JSON object to serialize.
         :type obj: str | bool | int | float | list | dict | None
         :return: Serialized string.
         :rtype: str
         """
-        return self._serializer(obj)
+        serialized = self._serializer(obj)
+        if isinstance(serialized, bytes):
+            return serialized.decode("utf-8")
+        return serialized
 
     def deserialize(self, string: str) -> Any:
         """De-serialize the string and return the object.
@@ -132,7 +155,10 @@ class BaseConnection(object):
                     auth=auth,
                 )
 
-                return self.prep_response(resp, request.deserialize)
+                deserialize = request.deserialize and (
+                    request.parse_body or not 200 <= resp.status_code < 300
+                )
+                return self.prep_response(resp, deserialize)
             except ConnectionError:
                 url = self._url_prefixes[host_index] + request.endpoint
                 logging.debug(f"ConnectionError: {url}")
@@ -158,31 +184,33 @@ class BaseConnection(object):
         :return: Child bulk error response.
         :rtype: aioarango.response.Response
         """
-        resp = Response(
-            method=parent_response.method,
-            url=parent_response.url,
-            headers=parent_response.headers,
-            status_code=parent_response.status_code,
-            status_text=parent_response.status_text,
-            raw_body=self.serialize(body),
-        )
+        # Fill the slots directly: the parent fields are already normalized,
+        # and Response.__init__ would only set defaults overwritten here.
+        resp = Response.__new__(Response)
+        resp.method = parent_response.method
+        resp.url = parent_response.url
+        resp.headers = parent_response.headers
+        resp.status_code = parent_response.status_code
+        resp.status_text = parent_response.status_text
+        resp.raw_body = self.serialize_str(body)
         resp.body = body
         resp.error_code = body["errorNum"]
         resp.error_message = body["errorMessage"]
         resp.is_success = False
         return resp
 
-    def normalize_data(self, data: Any) -> Union[str, MultipartEncoder, None]:
+    def normalize_data(self, data: Any) -> Union[str, bytes, None]:
         """Normalize request data.
 
-        :param data: Request data.
-        :type data: str | MultipartEncoder | None
+        :param data: Request data. Strings and bytes are taken as already
+            serialized and sent as is.
+        :type data: str | bytes | MultipartEncoder | None
         :return: Normalized data.
-        :rtype: str | MultipartEncoder | None
+        :rtype: str | bytes | None
         """
         if data is None:
             return None
-        elif isinstance(data, str):
+        elif isinstance(data, (str, bytes)):
             return data
         elif isinstance(data, MultipartEncoder):
             return data.read()
@@ -243,7 +271,7 @@ class BasicConnection(BaseConnection):
         username: str,
         password: str,
         http_client: HTTPClient,
-        serializer: Callable[..., str],
+        serializer: Callable[..., Union[str, bytes]],
         deserializer: Callable[[str], Any],
     ) -> None:
         super().__init__(
@@ -298,7 +326,7 @@ class JwtConnection(BaseConnection):
         username: str,
         password: str,
         http_client: HTTPClient,
-        serializer: Callable[..., str],
+        serializer: Callable[..., Union[str, bytes]],
         deserializer: Callable[[str], Any],
     ) -> None:
         super().__init__(
@@ -410,7 +438,7 @@ class JwtSuperuserConnection(BaseConnection):
         sessions: Sequence[httpx.AsyncClient],
         db_name: str,
         http_client: HTTPClient,
-        serializer: Callable[..., str],
+        serializer: Callable[..., Union[str, bytes]],
         deserializer: Callable[[str], Any],
         superuser_token: str,
     ) -> None:
@@ -1,5 +1,6 @@
+import asyncio
 from collections import deque
-from typing import Any, Deque, Optional, Sequence
+from typing import Any, AsyncIterator, Deque, List, Optional, Sequence
 
 from aioarango.connection import BaseConnection
 from aioarango.exceptions import (
@@ -13,6 +14,17 @@ from aioarango.request import Request
 from aioarango.typings import Json
 
 
+# Query statistics fields renamed to snake case, as (field, name) pairs.
+_STATS_RENAMES = (
+    ("writesExecuted", "modified"),
+    ("writesIgnored", "ignored"),
+    ("scannedFull", "scanned_full"),
+    ("scannedIndex", "scanned_index"),
+    ("executionTime", "execution_time"),
+    ("httpRequests", "http_requests"),
+)
+
+
 class Cursor:
     """Cursor API wrapper.
 
@@ -25,11 +37,16 @@ class Cursor:
     :type init_data: dict
     :param cursor_type: Cursor type ("cursor" or "export").
     :type cursor_type: str
+    :param prefetch: If set to True, the next batch is requested in the
+        background as soon as items are taken from the current one, so that
+        the server round-trip overlaps with processing on the client.
+    :type prefetch: bool
     """
 
     __slots__ = [
         "_conn",
         "_type",
+        "_endpoint_prefix",
         "_id",
         "_count",
         "_cached",
@@ -38,6 +55,8 @@ class Cursor:
         "_warnings",
         "_has_more",
         "_batch",
+        "_prefetch",
+        "_prefetch_task",
     ]
 
     def __init__(
@@ -45,9 +64,13 @@ class Cursor:
         connection: BaseConnection,
         init_data: Json,
         cursor_type: str = "cursor",
+        prefetch: bool = False,
     ) -> None:
         self._conn = connection
         self._type = cursor_type
+        self._endpoint_prefix = f"/_api/{cursor_type}/"
+        self._prefetch = prefetch
+        self._prefetch_task: Optional["asyncio.Future[Json]"] = None
         self._batch: Deque[Any] = deque()
         self._id = None
         self._count: Optional[int] = None
@@ -60,9 +83,6 @@ class Cursor:
     def __aiter__(self):
         return self
 
-    async def __anext__(self):  # pragma: no cover
-        return await self.next()
-
     async def __aenter__(self):
         return self
 
@@ -97,11 +117,13 @@ class Cursor:
             self._cached = data["cached"]
             result["cached"] = data["cached"]
 
-        self._has_more = bool(data["hasMore"])
-        result["has_more"] = data["hasMore"]
+        has_more = data["hasMore"]
+        self._has_more = bool(has_more)
+        result["has_more"] = has_more
 
-        self._batch.extend(data["result"])
-        result["batch"] = data["result"]
+        batch = data["result"]
+        self._batch.extend(batch)
+        result["batch"] = batch
 
         if "extra" in data:
             extra = data["extra"]
@@ -116,26 +138,9 @@ class Cursor:
 
             if "stats" in extra:
                 stats = extra["stats"]
-                if "writesExecuted" in stats:
-                    stats["modified"] = stats.pop("writesExecuted")
-                if "writesIgnored" in stats:
-                    stats["ignored"] = stats.pop("writesIgnored")
-                if "scannedFull" in stats:
-                    stats["scanned_full"] = stats.pop("scannedFull")
-                if "scannedIndex" in stats:
-                    stats["scanned_index"] = stats.pop("scannedIndex")
-                if "executionTime" in stats:
-                    stats["execution_time"] = stats.pop("executionTime")
-                if "httpRequests" in stats:
-                    stats["http_requests"] = stats.pop("httpRequests")
-                if "cursorsCreated" in stats:
-                    stats["cursorsCreated"] = stats.pop("cursorsCreated")
-                if "cursorsRearmed" in stats:
-                    stats["cursorsRearmed"] = stats.pop("cursorsRearmed")
-                if "cacheHits" in stats:
-                    stats["cacheHits"] = stats.pop("cacheHits")
-                if "cacheMisses" in stats:
-                    stats["cacheMisses"] = stats.pop("cacheMisses")
+                for field, name in _STATS_RENAMES:
+                    if field in stats:
+                        stats[name] = stats.pop(field)
                 self._stats = stats
                 result["statistics"] = stats
 
@@ -235,12 +240,18 @@ class Cursor:
         :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
         :raise aioarango.exceptions.CursorStateError: If cursor ID is not set.
         """
-        if self.empty():
-            if not self.has_more():
+        if not self._batch:
+            if not self._has_more:
                 raise StopAsyncIteration
             await self.fetch()
+            return self.pop()
+        elif self._prefetch and self._has_more and self._prefetch_task is None:
+            self._prefetch_task = asyncio.ensure_future(self._request_batch())
 
-        return self.pop()
+        return self._batch.popleft()
+
+    # Iteration awaits next() directly, without a wrapper coroutine per item.
+    __anext__ = next
 
     def pop(self) -> Any:
         """Pop the next item from current batch.
@@ -256,23 +267,90 @@ class Cursor:
             raise CursorEmptyError("current batch is empty")
         return self._batch.popleft()
 
+    def pop_batch(self) -> List[Any]:
+        """Pop all items from the current batch at once.
+
+        Unlike calling :func:`aioarango.cursor.Cursor.pop` repeatedly, this
+        does not go through Python-level iteration per item. No API request
+        is sent, so the result is empty if the current batch is depleted.
+
+        :return: Items in current batch.
+        :rtype: list
+        """
+        items = list(self._batch)
+        self._batch.clear()
+        return items
+
+    async def batches(self) -> AsyncIterator[List[Any]]:
+        """Iterate over the remaining items one batch at a time.
+
+        Each batch is popped from the cursor as a list, and the next one is
+        fetched from server once the loop moves on. This avoids a coroutine
+        step per item when iterating over large result sets.
+
+        :return: Async iterator over the remaining batches.
+        :rtype: collections.abc.AsyncIterator
+        :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
+        :raise aioarango.exceptions.CursorStateError: If cursor ID is not set.
+        """
+        while True:
+            if self._batch:
+                if self._prefetch and self._has_more and self._prefetch_task is None:
+                    self._prefetch_task = asyncio.ensure_future(self._request_batch())
+                yield self.pop_batch()
+            if not self._has_more:
+                return
+            await self.fetch()
+
+    async def to_list(self) -> List[Any]:
+        """Fetch all remaining batches and return the items in a list.
+
+        :return: Remaining items in the result set.
+        :rtype: list
+        :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
+        :raise aioarango.exceptions.CursorStateError: If cursor ID is not set.
+        """
+        items = self.pop_batch()
+        while self._has_more:
+            await self.fetch()
+            items.extend(self._batch)
+            self._batch.clear()
+        return items
+
     async def fetch(self) -> Json:
         """Fetch the next batch from server and update the cursor.
 
+        If the next batch was already prefetched in the background, it is used
+        instead of sending another request.
+
         :return: New batch details.
         :rtype: dict
         :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
         :raise aioarango.exceptions.CursorStateError: If cursor ID is not set.
         """
+        if self._prefetch_task is not None:
+            task, self._prefetch_task = self._prefetch_task, None
+            return self._update(await task)
+        return self._update(await self._request_batch())
+
+    async def _request_batch(self) -> Json:
+        """Request the next batch from server without updating the cursor.
+
+        :return: Cursor data from ArangoDB server.
+        :rtype: dict
+        :raise aioarango.exceptions.CursorNextError: If batch retrieval fails.
+        :raise aioarango.exceptions.CursorStateError: If cursor ID is not set.
+        """
         if self._id is None:
             raise CursorStateError("cursor ID not set")
-        request = Request(method="put", endpoint=f"/_api/{self._type}/{self._id}")
+        request = Request(method="put", endpoint=self._endpoint_prefix + self._id)
         resp = await self._conn.send_request(request)
 
         if not resp.is_success:
             raise CursorNextError(resp, request)
 
-        return self._update(resp.body)
+        body: Json = resp.body
+        return body
 
     async def close(self, ignore_missing: bool = False) -> Optional[bool]:
         """Close the cursor and free any server resources tied to it.
@@ -287,9 +365,20 @@ class Cursor:
         :raise aioarango.exceptions.CursorCloseError: If operation fails.
         :raise aioarango.exceptions.CursorStateError: If cursor ID is not set.
         """
+        if self._prefetch_task is not None:
+            task, self._prefetch_task = self._prefetch_task, None
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled() and task.exception() is None:
+                # The prefetched batch was already removed from the server, so
+                # apply it. If it was the last one, the server side cursor is
+                # gone and there is nothing left to delete.
+                self._update(task.result())
+                if not self._has_more:
+                    return None
         if self._id is None:
             return None
-        request = Request(method="delete", endpoint=f"/_api/{self._type}/{self._id}")
+        request = Request(method="delete", endpoint=self._endpoint_prefix + self._id)
         resp = await self._conn.send_request(request)
         if resp.is_success:
             return True
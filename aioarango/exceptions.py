@@ -166,6 +166,10 @@ class AsyncExecuteError(ArangoServerError):
     """Failed to execute async API request."""
 
 
+class AsyncModeError(ArangoClientError):
+    """Async mode was requested outside the default execution context."""
+
+
 class AsyncJobListError(ArangoServerError):
     """Failed to retrieve async jobs."""
 
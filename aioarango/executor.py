@@ -139,7 +139,12 @@ class BatchApiExecutor:
                 buffer.append(f"{key}: {value}")
 
         if request.data is not None:
-            serialized = self._conn.serialize(request.data)
+            if isinstance(request.data, bytes):
+                serialized = request.data
+            else:
+                serialized = self._conn.serialize(request.data)
+            if isinstance(serialized, bytes):
+                serialized = serialized.decode("utf-8")
             buffer.append("\r\n" + serialized)
 
         return "\r\n".join(buffer)
@@ -904,19 +904,21 @@ def format_vertex(body: Json) -> Json:
     :rtype: dict
     """
     vertex: Json = body["vertex"]
-    if "_oldRev" in vertex:
-        vertex["_old_rev"] = vertex.pop("_oldRev")
-
-    if "new" in body or "old" in body:
-        result: Json = {"vertex": vertex}
-        if "new" in body:
-            result["new"] = body["new"]
-        if "old" in body:
-            result["old"] = body["old"]
-        return result
-    else:
+    old_rev = vertex.pop("_oldRev", None)
+    if old_rev is not None:
+        vertex["_old_rev"] = old_rev
+
+    # Plain writes return the metadata as is, without building a new dict.
+    if "new" not in body and "old" not in body:
         return vertex
 
+    result: Json = {"vertex": vertex}
+    if "new" in body:
+        result["new"] = body["new"]
+    if "old" in body:
+        result["old"] = body["old"]
+    return result
+
 
 def format_edge(body: Json) -> Json:
     """Format edge data.
@@ -927,19 +929,21 @@ def format_edge(body: Json) -> Json:
     :rtype: dict
     """
     edge: Json = body["edge"]
-    if "_oldRev" in edge:
-        edge["_old_rev"] = edge.pop("_oldRev")
-
-    if "new" in body or "old" in body:
-        result: Json = {"edge": edge}
-        if "new" in body:
-            result["new"] = body["new"]
-        if "old" in body:
-            result["old"] = body["old"]
-        return result
-    else:
+    old_rev = edge.pop("_oldRev", None)
+    if old_rev is not None:
+        edge["_old_rev"] = old_rev
+
+    # Plain writes return the metadata as is, without building a new dict.
+    if "new" not in body and "old" not in body:
         return edge
 
+    result: Json = {"edge": edge}
+    if "new" in body:
+        result["new"] = body["new"]
+    if "old" in body:
+        result["old"] = body["old"]
+    return result
+
 
 def format_tls(body: Json) -> Json:
     """Format TLS data.
@@ -70,10 +70,12 @@ class Foxx(ApiGroup):
         }
 
         if config is not None:
-            fields["configuration"] = self._conn.serialize(config).encode("utf-8")
+            fields["configuration"] = self._conn.serialize_str(config).encode("utf-8")
 
         if dependencies is not None:
-            fields["dependencies"] = self._conn.serialize(dependencies).encode("utf-8")
+            fields["dependencies"] = self._conn.serialize_str(dependencies).encode(
+                "utf-8"
+            )
 
         return MultipartEncoder(fields=fields)
 
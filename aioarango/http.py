@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import MutableMapping, Optional, Tuple
+from typing import MutableMapping, Optional, Tuple, Union
 
 import httpx
 
@@ -30,7 +30,7 @@ class HTTPClient(ABC):  # pragma: no cover
             url: str,
             headers: Optional[Headers] = None,
             params: Optional[MutableMapping[str, str]] = None,
-            data: Optional[str] = None,
+            data: Union[str, bytes, None] = None,
             auth: Optional[Tuple[str, str]] = None,
     ) -> Response:
         """Send an HTTP request.
@@ -48,7 +48,7 @@ class HTTPClient(ABC):  # pragma: no cover
         :param params: URL (query) parameters.
         :type params: dict
         :param data: Request payload.
-        :type data: str | None
+        :type data: str | bytes | None
         :param auth: Username and password.
         :type auth: tuple
         :returns: HTTP response.
@@ -62,6 +62,8 @@ class DefaultHTTPClient(HTTPClient):
 
     REQUEST_TIMEOUT = 60
     RETRY_ATTEMPTS = 3
+    POOL_SIZE = 100
+    HTTP2 = False
 
     def create_session(self, host: str, verify: bool = True) -> httpx.AsyncClient:
         """Create and return a new session/connection.
@@ -73,7 +75,16 @@ class DefaultHTTPClient(HTTPClient):
         :type host: str | unicode
         :type verify: bool
         """
-        transport = httpx.AsyncHTTPTransport(retries=self.RETRY_ATTEMPTS, verify=verify)
+        limits = httpx.Limits(
+            max_connections=self.POOL_SIZE,
+            max_keepalive_connections=self.POOL_SIZE,
+        )
+        transport = httpx.AsyncHTTPTransport(
+            retries=self.RETRY_ATTEMPTS,
+            verify=verify,
+            limits=limits,
+            http2=self.HTTP2,
+        )
         return httpx.AsyncClient(transport=transport)
 
     async def send_request(
@@ -83,7 +94,7 @@ class DefaultHTTPClient(HTTPClient):
             url: str,
             headers: Optional[Headers] = None,
             params: Optional[MutableMapping[str, str]] = None,
-            data: Optional[str] = None,
+            data: Union[str, bytes, None] = None,
             auth: Optional[Tuple[str, str]] = None,
     ) -> Response:
         """Send an HTTP request.
@@ -99,7 +110,7 @@ class DefaultHTTPClient(HTTPClient):
         :param params: URL (query) parameters.
         :type params: dict
         :param data: Request payload.
-        :type data: str | None
+        :type data: str | bytes | None
         :param auth: Username and password.
         :type auth: tuple
         :returns: HTTP response.
@@ -109,7 +120,7 @@ class DefaultHTTPClient(HTTPClient):
             method=method,
             url=url,
             params=params,
-            data=data,
+            content=data,
             headers=headers,
             auth=auth,
             timeout=self.REQUEST_TIMEOUT,
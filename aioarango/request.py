@@ -2,15 +2,23 @@ from typing import Any, MutableMapping, Optional
 from aioarango.typings import DriverFlags, Fields, Headers, Params
 
 
+_DRIVER_VERSION = "7.5.3"
+
+# Driver header sent by requests without driver flags (nearly all of them).
+_DEFAULT_DRIVER_HEADER = "python-arango/" + _DRIVER_VERSION + " ()"
+
+# URL parameter values of booleans, looked up instead of int() and str().
+_BOOL_PARAMS = {True: "1", False: "0"}
+
+
 def normalize_headers(
         headers: Optional[Headers], driver_flags: Optional[DriverFlags] = None
 ) -> Headers:
-    flags = ""
-    if driver_flags is not None:
-        for flag in driver_flags:
-            flags = flags + flag + ";"
-    driver_version = "7.5.3"
-    driver_header = "python-arango/" + driver_version + " (" + flags + ")"
+    if driver_flags is None:
+        driver_header = _DEFAULT_DRIVER_HEADER
+    else:
+        flags = "".join(flag + ";" for flag in driver_flags)
+        driver_header = "python-arango/" + _DRIVER_VERSION + " (" + flags + ")"
     normalized_headers: Headers = {
         "charset": "utf-8",
         "content-type": "application/json",
@@ -28,10 +36,10 @@ def normalize_params(params: Optional[Params]) -> MutableMapping[str, str]:
 
     if params is not None:
         for key, value in params.items():
-            if isinstance(value, bool):
-                value = int(value)
-
-            normalized_params[key] = str(value)
+            if value.__class__ is bool:
+                normalized_params[key] = _BOOL_PARAMS[value]
+            else:
+                normalized_params[key] = str(value)
 
     return normalized_params
 
@@ -82,6 +90,9 @@ class Request:
     :vartype exclusive: str | [str] | None
     :ivar deserialize: Whether the response body can be deserialized.
     :vartype deserialize: bool
+    :ivar parse_body: Whether the body of a successful response is needed.
+        If set to False, only error responses are deserialized.
+    :vartype parse_body: bool
     :ivar driver_flags: List of flags for the driver
     :vartype driver_flags: list
     """
@@ -96,6 +107,7 @@ class Request:
         "write",
         "exclusive",
         "deserialize",
+        "parse_body",
         "driver_flags",
     )
 
@@ -111,6 +123,7 @@ class Request:
             exclusive: Optional[Fields] = None,
             deserialize: bool = True,
             driver_flags: Optional[DriverFlags] = None,
+            parse_body: bool = True,
     ) -> None:
         self.method = method
         self.endpoint = endpoint
@@ -121,4 +134,5 @@ class Request:
         self.write = write
         self.exclusive = exclusive
         self.deserialize = deserialize
+        self.parse_body = parse_body
         self.driver_flags = driver_flags
@@ -1,10 +1,14 @@
 import logging
 from contextlib import contextmanager
+from numbers import Number
 from typing import Any, Iterator, Sequence, Union
 
 from aioarango.exceptions import DocumentParseError
 from aioarango.typings import Json
 
+# Concrete types matched by is_number() without an abstract base class check.
+_NUMBER_TYPES = (int, float)
+
 
 @contextmanager
 def suppress_warning(logger_name: str) -> Iterator[None]:
@@ -29,12 +33,14 @@ def get_col_name(doc: Union[str, Json]) -> str:
     :rtype: str
     :raise aioarango.exceptions.DocumentParseError: If document ID is missing.
     """
+    if type(doc) is str:
+        return doc.partition("/")[0]
     try:
         doc_id: str = doc["_id"] if isinstance(doc, dict) else doc
     except KeyError:
         raise DocumentParseError('field "_id" required')
     else:
-        return doc_id.split("/", 1)[0]
+        return doc_id.partition("/")[0]
 
 
 def get_doc_id(doc: Union[str, Json]) -> str:
@@ -46,6 +52,8 @@ def get_doc_id(doc: Union[str, Json]) -> str:
     :rtype: str
     :raise aioarango.exceptions.DocumentParseError: If document ID is missing.
     """
+    if type(doc) is str:
+        return doc
     try:
         doc_id: str = doc["_id"] if isinstance(doc, dict) else doc
     except KeyError:
@@ -57,23 +65,41 @@ def get_doc_id(doc: Union[str, Json]) -> str:
 def is_none_or_int(obj: Any) -> bool:
     """Check if obj is None or an integer.
 
+    Plain ints are matched by exact type first, like in :func:`is_number`.
+
     :param obj: Object to check.
     :type obj: object
     :return: True if object is None or an integer.
     :rtype: bool
     """
-    return obj is None or (isinstance(obj, int) and obj >= 0)
+    return obj is None or ((type(obj) is int or isinstance(obj, int)) and obj >= 0)
+
+
+def is_number(obj: Any) -> bool:
+    """Check if obj is a number.
+
+    Plain ints and floats are matched by exact type first, which avoids the
+    slower abstract base class check for the common case.
+
+    :param obj: Object to check.
+    :type obj: object
+    :return: True if object is a number.
+    :rtype: bool
+    """
+    return type(obj) in _NUMBER_TYPES or isinstance(obj, Number)
 
 
 def is_none_or_str(obj: Any) -> bool:
     """Check if obj is None or a string.
 
+    Plain strings are matched by exact type first, like in :func:`is_number`.
+
     :param obj: Object to check.
     :type obj: object
     :return: True if object is None or a string.
     :rtype: bool
     """
-    return obj is None or isinstance(obj, str)
+    return obj is None or type(obj) is str or isinstance(obj, str)
 
 
 def get_batches(elements: Sequence[Json], batch_size: int) -> Iterator[Sequence[Json]]:
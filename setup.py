@@ -14,7 +14,7 @@ setup(
     keywords=["arangodb", "python", "driver"],
     packages=find_packages(exclude=["tests"]),
     include_package_data=True,
-    python_requires=">=3.7",
+    python_requires=">=3.11",
     license="MIT",
     install_requires=[
         "urllib3>=1.26.0",
@@ -25,6 +25,8 @@ setup(
         "setuptools>=42",
     ],
     extras_require={
+        "orjson": ["orjson>=3.8.0"],
+        "http2": ["h2>=4.1.0"],
         "dev": [
             "black>=22.3.0",
             "flake8>=4.0.1",
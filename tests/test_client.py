@@ -5,7 +5,7 @@ import pytest
 from pkg_resources import get_distribution
 from requests import Session
 
-from aioarango.client import ArangoClient
+from aioarango.client import ArangoClient, default_deserializer, default_serializer
 from aioarango.database import StandardDatabase
 from aioarango.exceptions import ServerConnectionError
 from aioarango.http import DefaultHTTPClient
@@ -59,6 +59,38 @@ async def test_client_attributes():
     client = ArangoClient(hosts=client_hosts, request_timeout=120)
     assert client.request_timeout == client._http.REQUEST_TIMEOUT == 120
 
+    client = ArangoClient(hosts=client_hosts, pool_size=10)
+    assert client.pool_size == client._http.POOL_SIZE == 10
+
+
+async def test_client_default_serializer():
+    obj = {"foo": [1, 2.5, None, True, "bär"], "bar": {"baz": "qux"}}
+    assert json.loads(default_serializer(obj)) == obj
+    assert default_deserializer(json.dumps(obj)) == obj
+
+    # Objects orjson rejects fall back to the json module
+    assert json.loads(default_serializer({1: "foo"})) == {"1": "foo"}
+
+
+async def test_client_http2(monkeypatch):
+    client = ArangoClient(hosts="http://127.0.0.1:8529")
+    assert client._http.HTTP2 is False
+
+    # Record the flag each session is created with, so h2 is not required
+    created = []
+    monkeypatch.setattr(
+        DefaultHTTPClient,
+        "create_session",
+        lambda self, host, verify=True: created.append(self.HTTP2),
+    )
+    client = ArangoClient(
+        hosts=["http://127.0.0.1:8529", "http://localhost:8529"], http2=True
+    )
+    assert isinstance(client._http, DefaultHTTPClient)
+    assert client._http.HTTP2 is True
+    assert created == [True, True]
+    assert DefaultHTTPClient.HTTP2 is False
+
 
 async def test_client_good_connection(db: StandardDatabase, username, password):
     client = ArangoClient(hosts="http://127.0.0.1:8529")
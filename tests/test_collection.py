@@ -1,8 +1,11 @@
+import asyncio
+
 import pytest
 
 from aioarango.collection import StandardCollection
 from aioarango.database import StandardDatabase
 from aioarango.exceptions import (
+    AsyncModeError,
     CollectionChecksumError,
     CollectionConfigureError,
     CollectionCreateError,
@@ -17,6 +20,7 @@ from aioarango.exceptions import (
     CollectionTruncateError,
     CollectionUnloadError,
 )
+from aioarango.job import AsyncJob
 from tests.helpers import assert_raises, extract, generate_col_name
 
 pytestmark = pytest.mark.asyncio
@@ -129,6 +133,53 @@ async def test_collection_misc_methods(col: StandardCollection, bad_col: Standar
     assert err.value.error_code in {11, 1228}
 
 
+async def test_collection_async_mode(
+    db: StandardDatabase, col: StandardCollection, bad_col: StandardCollection, docs
+):
+    await col.insert_many(docs)
+
+    async def wait_on_job(job: AsyncJob):
+        while await job.status() != "done":
+            await asyncio.sleep(0.05)  # pragma: no cover
+        return job
+
+    # Test truncate in async mode
+    job = await col.truncate(async_mode=True)
+    assert isinstance(job, AsyncJob)
+    assert await (await wait_on_job(job)).result() is True
+    assert await col.count() == 0
+
+    # Test load, unload and recalculate count in async mode
+    for method in (col.load, col.unload, col.recalculate_count):
+        job = await method(async_mode=True)
+        assert isinstance(job, AsyncJob)
+        assert await (await wait_on_job(job)).result() is True
+
+    # Test configure in async mode
+    job = await col.configure(sync=True, async_mode=True)
+    assert isinstance(job, AsyncJob)
+    properties = await (await wait_on_job(job)).result()
+    assert properties["name"] == col.name
+    assert properties["sync"] is True
+
+    # Test truncate in async mode with bad collection
+    job = await bad_col.truncate(async_mode=True)
+    with assert_raises(CollectionTruncateError) as err:
+        await (await wait_on_job(job)).result()
+    assert err.value.error_code in {11, 1228}
+
+    # Test async mode is rejected in a transaction
+    await col.insert_many(docs)
+    txn_db = await db.begin_transaction(write=col.name)
+    txn_col = txn_db.collection(col.name)
+    for method in (txn_col.truncate, txn_col.load, txn_col.recalculate_count):
+        with pytest.raises(AsyncModeError) as err:
+            await method(async_mode=True)
+        assert err.value.message == "async mode not supported in transaction context"
+    await txn_db.abort_transaction()
+    assert await col.count() == len(docs)
+
+
 async def test_collection_management(db: StandardDatabase, bad_db: StandardDatabase, cluster):
     # Test create collection
     col_name = generate_col_name()
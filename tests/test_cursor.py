@@ -1,6 +1,10 @@
+import asyncio
+import gc
+
 import pytest
 
 from aioarango.collection import StandardCollection
+from aioarango.connection import Connection
 from aioarango.database import StandardDatabase
 from aioarango.exceptions import (
     CursorCloseError,
@@ -9,6 +13,7 @@ from aioarango.exceptions import (
     CursorNextError,
     CursorStateError,
 )
+from aioarango.request import Request
 from tests.helpers import clean_doc
 
 pytestmark = pytest.mark.asyncio
@@ -266,6 +271,101 @@ async def test_cursor_manual_fetch_and_pop(db: StandardDatabase, col: StandardCo
     assert err.value.message == "current batch is empty"
 
 
+async def test_cursor_pop_batch_and_to_list(db: StandardDatabase, col: StandardCollection, docs):
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d",
+        count=True,
+        batch_size=2,
+        ttl=1000,
+    )
+    assert clean_doc(cursor.pop_batch()) == docs[:2]
+    assert cursor.empty()
+    assert cursor.pop_batch() == []
+    assert cursor.has_more() is True
+
+    assert clean_doc(await cursor.to_list()) == docs[2:]
+    assert cursor.empty()
+    assert cursor.has_more() is False
+    assert await cursor.to_list() == []
+
+
+async def test_cursor_batches(db: StandardDatabase, col: StandardCollection, docs):
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d",
+        count=True,
+        batch_size=4,
+        ttl=1000,
+    )
+    assert clean_doc(await cursor.next()) == docs[0]
+    batches = [batch async for batch in cursor.batches()]
+    assert [len(batch) for batch in batches] == [3, 2]
+    assert clean_doc(batches[0] + batches[1]) == docs[1:]
+    assert cursor.empty()
+    assert cursor.has_more() is False
+
+
+async def test_cursor_prefetch(
+    db: StandardDatabase, col: StandardCollection, conn: Connection, docs
+):
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d",
+        count=True,
+        batch_size=2,
+        ttl=1000,
+        prefetch=True,
+    )
+    assert clean_doc([item async for item in cursor]) == docs
+    assert cursor.empty()
+    assert cursor.has_more() is False
+
+    # Test closing the cursor with a batch being prefetched
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d",
+        batch_size=2,
+        ttl=1000,
+        prefetch=True,
+    )
+    assert clean_doc(await cursor.next()) == docs[0]
+    assert await cursor.close() is True
+
+    # Test closing the cursor after the last batch was prefetched
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d",
+        batch_size=3,
+        ttl=1000,
+        prefetch=True,
+    )
+    assert clean_doc(await cursor.next()) == docs[0]
+    await asyncio.wait([cursor._prefetch_task])
+    assert await cursor.close() is None
+    assert cursor.has_more() is False
+    assert clean_doc(list(cursor.batch())) == docs[1:]
+
+    # Test closing the cursor after a failed prefetch
+    cursor = await db.aql.execute(
+        f"FOR d IN {col.name} SORT d._key RETURN d",
+        batch_size=2,
+        ttl=1000,
+        prefetch=True,
+    )
+    request = Request(method="delete", endpoint=f"/_api/cursor/{cursor.id}")
+    assert (await conn.send_request(request)).is_success
+
+    unhandled = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+    try:
+        assert clean_doc(await cursor.next()) == docs[0]
+        task = cursor._prefetch_task
+        await asyncio.wait([task])
+        assert await cursor.close(ignore_missing=True) is False
+        del task
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+    assert unhandled == []
+
+
 async def test_cursor_no_count(db: StandardDatabase, col: StandardCollection):
     cursor = await db.aql.execute(
         f"FOR d IN {col.name} SORT d._key RETURN d",
@@ -1,14 +1,12 @@
+import json
+
 import pytest
 
-<<<<<<< HEAD
-from arango.exceptions import (
-=======
 from aioarango.collection import StandardCollection
 from aioarango.database import StandardDatabase
 from aioarango.exceptions import (
     CursorCloseError,
     CursorNextError,
->>>>>>> aioarango/main
     DocumentCountError,
     DocumentDeleteError,
     DocumentGetError,
@@ -28,6 +26,7 @@ from tests.helpers import (
     extract,
     generate_col_name,
     generate_doc_key,
+    generate_view_name,
 )
 
 pytestmark = pytest.mark.asyncio
@@ -52,6 +51,12 @@ async def test_document_insert(col: StandardCollection, docs):
         await col.insert({"_id": generate_col_name() + "/" + "foo"})
     assert "bad collection name" in err.value.message
 
+    # Test insert pre-serialized document
+    result = await col.insert(json.dumps({"_key": "bar", "val": 1}).encode("utf-8"))
+    assert result["_key"] == "bar"
+    assert (await col.get("bar"))["val"] == 1
+    await empty_collection(col)
+
     # Test insert with default options
     for doc in docs:
         result = await col.insert(doc)
@@ -162,6 +167,20 @@ async def test_document_insert_many(col: StandardCollection, bad_col: StandardCo
     assert await col.count() == len(docs)
     await empty_collection(col)
 
+    # Test insert_many with pre-serialized documents
+    results = await col.insert_many(json.dumps(docs).encode("utf-8"))
+    assert extract("_key", results) == extract("_key", docs)
+    assert await col.count() == len(docs)
+    await empty_collection(col)
+
+    # Test insert_many with chunk_size
+    results = await col.insert_many(docs, chunk_size=2)
+    assert len(results) == len(docs)
+    for result, doc in zip(results, docs):
+        assert result["_key"] == doc["_key"]
+    assert await col.count() == len(docs)
+    await empty_collection(col)
+
     # Test insert_many with document IDs
     docs_with_id = [{"_id": col.name + "/" + doc["_key"]} for doc in docs]
     results = await col.insert_many(docs_with_id)
@@ -1262,6 +1281,15 @@ async def test_document_find_in_range(col: StandardCollection, bad_col: Standard
     result = [doc async for doc in await col.find_in_range("val", lower=1, upper=5, skip=2)]
     assert extract("_key", result) == ["3", "4"]
 
+    # Test find_in_range with cursor options
+    cursor = await col.find_in_range("val", lower=1, upper=5, batch_size=1, ttl=10)
+    assert len(cursor.batch()) == 1
+    result = [doc async for doc in cursor]
+    assert extract("_key", result) == ["1", "2", "3", "4"]
+
+    cursor = await col.find_in_range("val", lower=1, upper=5, count=False)
+    assert cursor.count() is None
+
     # Test find_in_range with bad collection
     with assert_raises(DocumentGetError) as err:
         await bad_col.find_in_range(field="val", lower=1, upper=2, skip=2)
@@ -1296,6 +1324,27 @@ async def test_document_find_in_radius(col: StandardCollection, bad_col: Standar
     assert len(result) == 1
     assert clean_doc(result[0]) == {"_key": "1", "loc": [1, 1], "dist": 0}
 
+    # Test find_in_radius with a [longitude, latitude] location field
+    result = list(
+        [doc async for doc in await col.find_in_radius(
+            latitude=1, longitude=4, radius=6, distance_field="dist", field="loc"
+        )]
+    )
+    assert len(result) == 1
+    assert clean_doc(result[0]) == {"_key": "3", "loc": [4, 1], "dist": 0}
+
+    # Test find_in_radius with a location field returns the nearest first
+    result = [doc async for doc in await col.find_in_radius(
+        latitude=1, longitude=2, radius=300000, distance_field="dist", field="loc"
+    )]
+    assert [doc["_key"] for doc in result] == ["1", "3"]
+    assert result[0]["dist"] < result[1]["dist"]
+
+    result = [doc async for doc in await col.find_in_radius(
+        latitude=1, longitude=2, radius=300000, field="loc"
+    )]
+    assert [doc["_key"] for doc in result] == ["1", "3"]
+
     # Test find_in_radius with bad collection
     with assert_raises(DocumentGetError) as err:
         await bad_col.find_in_radius(3, 3, 10)
@@ -1427,6 +1476,49 @@ async def test_document_find_by_text(col: StandardCollection, docs):
     assert err.value.error_code == 1571
 
 
+async def test_document_find_by_text_view(
+    db: StandardDatabase, col: StandardCollection, docs
+):
+    other_col = await db.create_collection(generate_col_name())
+    view_name = generate_view_name()
+    link = {"fields": {"text": {"analyzers": ["text_en"]}}}
+    await db.create_arangosearch_view(
+        view_name, {"links": {col.name: link, other_col.name: link}}
+    )
+    try:
+        await col.import_bulk(docs)
+        await other_col.insert({"_key": "7", "text": "foo"})
+
+        # Wait for the view to index the inserted documents
+        await db.aql.execute(
+            "FOR doc IN @@view SEARCH true OPTIONS {waitForSync: true} RETURN 1",
+            bind_vars={"@view": view_name},
+        )
+
+        # Test find_by_text only returns matches from this collection
+        result = [doc async for doc in await col.find_by_text(
+            field="text", query="foo", view=view_name, analyzer="text_en"
+        )]
+        assert sorted(doc["_key"] for doc in result) == ["1", "2", "3"]
+        assert all(doc["_id"].startswith(col.name + "/") for doc in result)
+
+        # Test find_by_text with view and limit
+        result = [doc async for doc in await col.find_by_text(
+            field="text", query="bar", limit=2, view=view_name, analyzer="text_en"
+        )]
+        assert len(result) == 2
+        assert all(doc["text"] == "bar" for doc in result)
+
+        # Test find_by_text with missing view
+        with assert_raises(DocumentGetError):
+            await col.find_by_text(
+                field="text", query="foo", view=generate_view_name()
+            )
+    finally:
+        await db.delete_view(view_name)
+        await db.delete_collection(other_col.name)
+
+
 async def test_document_has(col: StandardCollection, bad_col: StandardCollection, docs):
     # Set up test document
     result = await col.insert(docs[0])
@@ -1636,6 +1728,33 @@ async def test_document_get_many(col: StandardCollection, bad_col: StandardColle
     assert err.value.error_code in {11, 1228}
 
 
+async def test_document_has_many(col: StandardCollection, bad_col: StandardCollection, docs):
+    # Set up test documents
+    await col.import_bulk(docs[:2])
+    missing_key = generate_doc_key()
+
+    # Test has_many with keys, IDs and bodies
+    result = await col.has_many(
+        [docs[0]["_key"], f"{col.name}/{docs[1]['_key']}", {"_key": missing_key}]
+    )
+    assert result == [True, True, False]
+
+    result = await col.has_many(docs)
+    assert result == [True, True] + [False] * (len(docs) - 2)
+
+    # Test has_many with empty input
+    assert await col.has_many([]) == []
+
+    # Test has_many with an illegal document key
+    with assert_raises(DocumentInError) as err:
+        await col.has_many([docs[0]["_key"], "bad key"])
+    assert err.value.error_code in {1205, 1221}
+
+    with assert_raises(DocumentInError) as err:
+        await bad_col.has_many(docs)
+    assert err.value.error_code in {11, 1228}
+
+
 async def test_document_all(col: StandardCollection, bad_col: StandardCollection, docs):
     # Set up test documents
     await col.import_bulk(docs)
@@ -1736,9 +1855,6 @@ async def test_document_keys(col: StandardCollection, bad_col: StandardCollectio
     assert err.value.error_code in {11, 1228}
 
 
-<<<<<<< HEAD
-def test_document_random(col, bad_col, docs):
-=======
 async def test_document_export(col: StandardCollection, bad_col: StandardCollection, docs, cluster):
     if cluster:
         pytest.skip("Not tested in a cluster setup")
@@ -1812,7 +1928,6 @@ async def test_document_export(col: StandardCollection, bad_col: StandardCollect
 
 
 async def test_document_random(col: StandardCollection, bad_col: StandardCollection, docs):
->>>>>>> aioarango/main
     # Set up test documents
     await col.import_bulk(docs)
 
@@ -1909,6 +2024,16 @@ async def test_document_import_bulk(col: StandardCollection, bad_col: StandardCo
     assert len(result) == 1
     empty_collection(col)
 
+    # Test import bulk with pre-serialized line-delimited documents
+    result = await col.import_bulk(b"\n".join(json.dumps(d).encode() for d in docs))
+    assert result["created"] == len(docs)
+    await empty_collection(col)
+
+    results = await col.import_bulk(docs, batch_size=1, max_in_flight=2)
+    assert len(results) == len(docs)
+    assert all(result["created"] == 1 for result in results)
+    await empty_collection(col)
+
     # Test import bulk with overwrite and batch_size
     with pytest.raises(ValueError):
         col.import_bulk(docs, overwrite=True, batch_size=1)
@@ -948,6 +948,15 @@ async def test_edge_management(
     assert await ecol.count() == len(edocs)
     await empty_collection(ecol)
 
+    # Test insert multiple edges using link_many method
+    results = await ecol.link_many(
+        [(edge["_from"], edge["_to"]) for edge in edocs],
+        data=[{"_key": edge["_key"]} for edge in edocs],
+    )
+    assert [result["_key"] for result in results] == [edge["_key"] for edge in edocs]
+    assert await ecol.count() == len(edocs)
+    await empty_collection(ecol)
+
     await ecol.insert_many(edocs)
     assert await ecol.count() == len(edocs)
 
@@ -202,6 +202,36 @@ async def test_add_ttl_index(icol: StandardCollection):
     await icol.delete_index(result["id"])
 
 
+async def test_add_indexes(icol: StandardCollection, bad_col: StandardCollection):
+    results = await icol.add_indexes(
+        [
+            {"type": "persistent", "fields": ["attr5"], "name": "persistent_index"},
+            {"type": "ttl", "fields": ["attr6"], "expireAfter": 1000},
+        ]
+    )
+    assert len(results) == 2
+    assert results[0]["type"] == "persistent"
+    assert results[0]["fields"] == ["attr5"]
+    assert results[0]["name"] == "persistent_index"
+    assert results[1]["type"] == "ttl"
+    assert results[1]["expiry_time"] == 1000
+
+    index_ids = extract("id", await icol.indexes())
+    for result in results:
+        assert result["id"] in index_ids
+
+    assert await icol.add_indexes([]) == []
+
+    # Test add indexes with bad collection
+    with assert_raises(IndexCreateError) as err:
+        await bad_col.add_indexes([{"type": "persistent", "fields": ["attr5"]}])
+    assert err.value.error_code in {11, 1228}
+
+    # Clean up the indexes
+    for result in results:
+        await icol.delete_index(result["id"])
+
+
 async def test_delete_index(icol: StandardCollection, bad_col: StandardCollection):
     old_indexes = set(extract("id", await icol.indexes()))
     await icol.add_hash_index(["attr3", "attr4"], unique=True)
@@ -66,3 +66,13 @@ def test_request_transaction_data() -> None:
     assert request.headers["content-type"] == "application/json"
     assert request.headers["foo"] == "bar"
     assert request.data == {"baz": "qux"}
+
+
+def test_request_parse_body() -> None:
+    request = Request(method="put", endpoint="/_api/test")
+    assert request.deserialize is True
+    assert request.parse_body is True
+
+    request = Request(method="put", endpoint="/_api/test", parse_body=False)
+    assert request.deserialize is True
+    assert request.parse_body is False